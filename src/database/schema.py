@@ -195,6 +195,7 @@ DDL: list[str] = [
     "CREATE INDEX IF NOT EXISTS idx_plays_season_week ON plays(season, week);",
     "CREATE INDEX IF NOT EXISTS idx_plays_receiver ON plays(receiver_id);",
     "CREATE INDEX IF NOT EXISTS idx_plays_passer ON plays(passer_id);",
+    "CREATE INDEX IF NOT EXISTS idx_plays_rusher ON plays(rusher_id);",
     "CREATE INDEX IF NOT EXISTS idx_games_season_week ON games(season, week);",
 ]
 
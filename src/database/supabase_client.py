@@ -8,16 +8,42 @@ from typing import Any, Callable, Optional
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # optional: faster parsing of large select responses
+    orjson = None  # type: ignore[assignment]
 
 
 class SupabaseError(RuntimeError):
-    pass
+    def __init__(self, message: str, *, status_code: Optional[int] = None, body: str = "") -> None:
+        super().__init__(message)
+        # Set for non-2xx responses; None for transport errors.
+        self.status_code = status_code
+        self.body = body
 
 
 def _sleep(seconds: float) -> None:
     time.sleep(seconds)
 
 
+def _default_session() -> requests.Session:
+    # The server shares one client across ThreadingHTTPServer handler threads; requests' default pool
+    # keeps only 10 connections per host and drops (then re-handshakes) the rest under concurrent load.
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _loads(content: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 @dataclass(frozen=True)
 class SupabaseConfig:
     url: str
@@ -48,7 +74,7 @@ class SupabaseClient:
         sleep_fn: Callable[[float], None] = _sleep,
     ) -> None:
         self._cfg = cfg
-        self._session = session or requests.Session()
+        self._session = session or _default_session()
         self._max_retries = max_retries
         self._sleep = sleep_fn
 
@@ -181,8 +207,13 @@ class SupabaseClient:
             range_to=range_to,
         )
         if not (200 <= resp.status_code < 300):
-            raise SupabaseError(f"Select failed table={table} status={resp.status_code} body={resp.text[:500]}")
-        data = resp.json()
+            body = resp.text[:500]
+            raise SupabaseError(
+                f"Select failed table={table} status={resp.status_code} body={body}",
+                status_code=resp.status_code,
+                body=body,
+            )
+        data = _loads(resp.content)
         if not isinstance(data, list):
             raise SupabaseError(f"Unexpected select response type table={table} type={type(data)}")
         return data
@@ -41,9 +41,17 @@ def player_photo_url(player_id: str) -> Optional[str]:
     Prefers ESPN (high quality) then Sleeper.
     """
     try:
-        df = _player_ids_df()
+        _player_ids_df()
     except Exception:
         return None
+    return _photo_url_for_gsis(player_id)
+
+
+@lru_cache(maxsize=8192)
+def _photo_url_for_gsis(player_id: str) -> Optional[str]:
+    # Scans the id map once per player; only reached once the map has loaded, so a failed
+    # download is retried on the next call instead of being cached as "no photo".
+    df = _player_ids_df()
 
     if "gsis_id" not in df.columns:
         return None
@@ -63,8 +71,14 @@ def player_photo_url(player_id: str) -> Optional[str]:
     return None
 
 def dict_rows(cur: sqlite3.Cursor) -> list[dict[str, Any]]:
-    cols = [c[0] for c in cur.description] if cur.description else []
-    return [dict(zip(cols, row)) for row in cur.fetchall()]
+    cols = tuple(c[0] for c in cur.description) if cur.description else ()
+    # Rows become dicts anyway: fetch plain tuples instead of wrapping each one in a sqlite3.Row first.
+    cur.row_factory = None
+    out: list[dict[str, Any]] = []
+    # Batches keep ~1000 raw tuples alive next to the dicts instead of the whole result set twice.
+    while batch := cur.fetchmany(1000):
+        out.extend(dict(zip(cols, row)) for row in batch)
+    return out
 
 
 def options(conn: sqlite3.Connection) -> dict[str, Any]:
@@ -355,10 +369,17 @@ def get_players_list(
     position: Optional[str],
     team: Optional[str],
     limit: int = 100,
+    player_id: Optional[str] = None,
 ) -> list[dict[str, Any]]:
     """Get list of players with season totals for filtering and display."""
     where = ["1=1"]
     params: list[Any] = []
+    # A single player is filtered inside the aggregates so only their plays are grouped.
+    recv_player = rush_player = ""
+    if player_id is not None:
+        recv_player = " AND receiver_id = ?"
+        rush_player = " AND rusher_id = ?"
+        params.extend([player_id, player_id])
     
     if season is not None:
         where.append("season = ?")
@@ -383,7 +404,7 @@ def get_players_list(
             SUM(CASE WHEN complete_pass = 1 THEN COALESCE(yards_gained, 0) ELSE 0 END) AS rec_yards,
             0 AS rec_tds
         FROM plays
-        WHERE receiver_id IS NOT NULL AND TRIM(receiver_id) != ''
+        WHERE receiver_id IS NOT NULL AND TRIM(receiver_id) != ''{recv_player}
         GROUP BY receiver_id, posteam, season
     ),
     rush_stats AS (
@@ -396,7 +417,7 @@ def get_players_list(
             SUM(COALESCE(yards_gained, 0)) AS yards,
             0 AS tds
         FROM plays
-        WHERE rusher_id IS NOT NULL AND TRIM(rusher_id) != '' AND rush = 1
+        WHERE rusher_id IS NOT NULL AND TRIM(rusher_id) != '' AND rush = 1{rush_player}
         GROUP BY rusher_id, posteam, season
     ),
     all_players AS (
@@ -453,6 +474,12 @@ def get_players_list(
     return dict_rows(cur)
 
 
+def get_player_season(conn: sqlite3.Connection, player_id: str, season: int) -> Optional[dict[str, Any]]:
+    """Season totals for one player (their top team row, same ordering as get_players_list)."""
+    rows = get_players_list(conn, season=season, position=None, team=None, limit=1, player_id=player_id)
+    return rows[0] if rows else None
+
+
 def get_player_game_logs(
     conn: sqlite3.Connection,
     player_id: str,
@@ -1,12 +1,24 @@
 from __future__ import annotations
 
 import csv
+import heapq
 import re
-from functools import lru_cache
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from functools import lru_cache, wraps
+from itertools import repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional
 
-from src.database.supabase_client import SupabaseClient
+from src.database.supabase_client import SupabaseClient, SupabaseError
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with pandas, but keep the web layer importable without it
+    np = None  # type: ignore[assignment]
 
 
 def player_photo_url(player_id: str) -> Optional[str]:
@@ -14,9 +26,10 @@ def player_photo_url(player_id: str) -> Optional[str]:
     return None
 
 
-_NAME_RE = re.compile(r"[^a-z0-9 ]+")
+_SEARCH_STRIP_RE = re.compile(r"[^a-zA-Z0-9 ]+")
+_SPACES_RE = re.compile(r"\s+")
 
-_SUFFIX_TOKENS = {"jr", "sr", "ii", "iii", "iv", "v"}
+_SUFFIX_TOKENS = frozenset({"jr", "sr", "ii", "iii", "iv", "v"})
 
 _TEAM_ABBR_ALIASES: dict[str, str] = {
     # ESPN-ish -> nflfastR-ish / dynastyprocess team codes in db_playerids.csv
@@ -32,29 +45,58 @@ _TEAM_ABBR_ALIASES: dict[str, str] = {
 }
 
 
-def _normalize_team_abbr(team: Optional[str]) -> str:
-    t = (team or "").strip().upper()
-    if not t:
-        return ""
-    return _TEAM_ABBR_ALIASES.get(t, t)
+# Defensive/special teams positions never shown on the offensive leaderboards.
+_BLOCKED_POSITIONS = frozenset(
+    {"DB", "CB", "S", "SS", "FS", "LB", "ILB", "OLB", "DL", "DE", "DT", "NT", "OL", "OT", "OG", "C", "K", "P", "LS"}
+)
+# Some feeds leave rookies as NULL/UNK/ROOKIE even though their stats prove the role.
+_UNKNOWN_POSITIONS = frozenset({"UNK", "UNKNOWN", "NULL", "ROOKIE"})
+# Default position scopes per leaderboard (`HB` is always treated as `RB`).
+_QB_POSITIONS = frozenset({"QB"})
+_RB_POSITIONS = frozenset({"RB"})
+_SKILL_POSITIONS = frozenset({"RB", "WR", "TE"})
+_RECEIVING_POSITIONS = frozenset({"WR", "TE", "RB"})
+_RUSHING_POSITIONS = frozenset({"RB", "QB", "WR", "TE"})
+
+# Raw nfl_players.position_abbreviation -> trimmed upper-case value (None when blank). Positions come
+# from a small fixed set, so per-row normalization is a dict hit instead of two string allocations.
+_POS_NORM: dict[Optional[str], Optional[str]] = {}
+
+
+def _norm_pos(raw: Any) -> Optional[str]:
+    try:
+        return _POS_NORM[raw]
+    except KeyError:
+        pos = (raw or "").strip().upper() or None
+        if len(_POS_NORM) < 256:
+            _POS_NORM[raw] = pos
+        return pos
+
+
+# ASCII bytes _merge_name drops: everything except a-z, 0-9 and space (non-ASCII is dropped by the encode).
+_NAME_DELETE_BYTES = bytes(c for c in range(128) if not (chr(c).isdigit() or "a" <= chr(c) <= "z" or c == 32))
 
 
 def _merge_name(name: str) -> str:
-    s = _NAME_RE.sub("", (name or "").lower()).strip()
-    s = re.sub(r"\s+", " ", s)
-    return s
+    # Same result as deleting [^a-z0-9 ] and collapsing spaces, without two regex passes per call.
+    s = (name or "").lower().encode("ascii", "ignore").translate(None, _NAME_DELETE_BYTES).decode("ascii")
+    return " ".join(s.split())
 
 
-def _merge_name_candidates(name: str) -> list[str]:
+@lru_cache(maxsize=4096)
+def _merge_name_candidates(name: str) -> tuple[str, ...]:
     """
     Generate candidate merge_name values to improve matches for suffixes like Jr/Sr/III.
+
+    Cached per name (the same player shows up under several teams/dashboards); returns a tuple so
+    the cached value can't be mutated by a caller.
     """
     base = _merge_name(name)
     if not base:
-        return []
+        return ()
     parts = base.split(" ")
     if not parts:
-        return [base]
+        return (base,)
 
     out: list[str] = [base]
 
@@ -72,49 +114,42 @@ def _merge_name_candidates(name: str) -> list[str]:
             out.append(first_last)
 
     # Deduplicate preserving order.
-    seen = set()
-    dedup: list[str] = []
-    for x in out:
-        if x in seen:
-            continue
-        seen.add(x)
-        dedup.append(x)
-    return dedup
+    return tuple(dict.fromkeys(out))
 
 
+@lru_cache(maxsize=8192)
 def player_photo_url_from_name_team(*, name: str, team: Optional[str]) -> Optional[str]:
     """
     Best-effort headshot URL based on player name + team.
 
     Uses dynastyprocess db_playerids.csv (already cached in hrb/data/db_playerids.csv).
     Prefers ESPN headshots, falls back to Sleeper.
+    Pure function of (name, team), so results are memoized across requests.
     """
-    maps = _photo_maps()
-    if not maps:
+    photo_map = _photo_maps()
+    if not photo_map:
         return None
-    by_name_team, by_name, by_last_team, by_last = maps
-
-    team_abbr = _normalize_team_abbr(team)
-    for mn in _merge_name_candidates(name):
-        ids = by_name_team.get((mn, team_abbr)) if team_abbr else None
-        if ids is None:
-            ids = by_name.get(mn)
-        if ids is None:
-            # Try last-name fallbacks
-            last = mn.split(" ")[-1] if mn else ""
-            if last:
-                ids = by_last_team.get((last, team_abbr)) if team_abbr else None
-                if ids is None:
-                    ids = by_last.get(last)
-        if ids is None:
-            continue
 
-        espn_id, sleeper_id = ids
-        if espn_id:
-            return f"https://a.espncdn.com/i/headshots/nfl/players/full/{espn_id}.png"
-        if sleeper_id:
-            return f"https://sleepercdn.com/content/nfl/players/{sleeper_id}.jpg"
-        return None
+    # ESPN-ish team codes -> db_playerids.csv codes (empty stays empty).
+    t = team.strip().upper() if team else ""
+    team_abbr = _TEAM_ABBR_ALIASES.get(t, t)
+    candidates = _merge_name_candidates(name)
+    # Full-name matches for every candidate (name+team, then name) before any last-name fallback, so a
+    # suffix-stripped full name beats a last-name guess on the raw name (e.g. "iii" for "... III").
+    for mn in candidates:
+        keys = ((_BY_NAME_TEAM, mn, team_abbr), (_BY_NAME, mn, "")) if team_abbr else ((_BY_NAME, mn, ""),)
+        for key in keys:
+            url = photo_map.get(key)
+            if url is not None:
+                # URLs are pre-built in _photo_maps; "" marks a matched player without any headshot id.
+                return url or None
+    for mn in candidates:
+        last = mn.rsplit(" ", 1)[-1]
+        keys = ((_BY_LAST_TEAM, last, team_abbr), (_BY_LAST, last, "")) if team_abbr else ((_BY_LAST, last, ""),)
+        for key in keys:
+            url = photo_map.get(key)
+            if url is not None:
+                return url or None
     return None
 
 
@@ -125,134 +160,445 @@ def _clean_id(v: Any) -> Optional[str]:
     return s
 
 
-PhotoMaps = tuple[
-    dict[tuple[str, str], tuple[Optional[str], Optional[str]]],
-    dict[str, tuple[Optional[str], Optional[str]]],
-    dict[tuple[str, str], tuple[Optional[str], Optional[str]]],
-    dict[str, tuple[Optional[str], Optional[str]]],
-]
+def _headshot_url(espn_id: Optional[str], sleeper_id: Optional[str]) -> str:
+    # Prefers ESPN headshots, falls back to Sleeper; "" when the row has neither id.
+    if espn_id:
+        return f"https://a.espncdn.com/i/headshots/nfl/players/full/{espn_id}.png"
+    if sleeper_id:
+        return f"https://sleepercdn.com/content/nfl/players/{sleeper_id}.jpg"
+    return ""
+
+
+# One flat map keyed by (kind, merge name or last name, team or ""), where kind is one of:
+_BY_NAME_TEAM, _BY_NAME, _BY_LAST_TEAM, _BY_LAST = range(4)
+PhotoMap = dict[tuple[int, str, str], str]
+_PLAYER_IDS_CSV = Path(__file__).resolve().parents[2] / "data" / "db_playerids.csv"
 
 
 @lru_cache(maxsize=1)
-def _photo_maps() -> Optional[PhotoMaps]:
+def _photo_maps() -> Optional[PhotoMap]:
     """
-    Load and cache (process-wide) the dynastyprocess db_playerids.csv lookup maps.
+    Load and cache (process-wide) the dynastyprocess db_playerids.csv headshot lookup map.
 
-    This is called for every player row rendered in the UI, so it must be fast.
+    This is called for every player row rendered in the UI, so it must be fast. The map lives in memory
+    only: building it is a single ~100ms CSV pass, and a read path shouldn't write files next to the data.
     """
-    repo_root = Path(__file__).resolve().parents[2]
-    path = repo_root / "data" / "db_playerids.csv"
+    path = _PLAYER_IDS_CSV
     if not path.exists():
         return None
+    return _build_photo_map(path)
 
-    # Keep "best" row per key by highest db_season (mirrors the old pandas sort/newest-first behavior).
-    by_name_team_s: dict[tuple[str, str], tuple[int, Optional[str], Optional[str]]] = {}
-    by_name_s: dict[str, tuple[int, Optional[str], Optional[str]]] = {}
-    by_last_team_s: dict[tuple[str, str], tuple[int, Optional[str], Optional[str]]] = {}
-    by_last_s: dict[str, tuple[int, Optional[str], Optional[str]]] = {}
 
+def _build_photo_map(path: Path) -> Optional[PhotoMap]:
+    # Keep "best" row per key by highest db_season (mirrors the old pandas sort/newest-first behavior).
     def _season_num(raw: Any) -> int:
         try:
             return int(str(raw or "").strip())
         except Exception:
             return -1
 
-    def _upsert_best(
-        m: dict[Any, tuple[int, Optional[str], Optional[str]]],
-        key: Any,
-        season: int,
-        espn: Optional[str],
-        sleeper: Optional[str],
-    ) -> None:
-        cur = m.get(key)
-        if cur is None or season > cur[0]:
-            m[key] = (season, espn, sleeper)
-
+    rows: list[tuple[int, str, str, str]] = []
     try:
         with open(path, "r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
+            # Plain csv.reader + column indexes: avoids building a ~40-key dict per row.
+            reader = csv.reader(f)
+            header = next(reader, [])
+            col = {h: i for i, h in enumerate(header)}
+            mn_i, tm_i, sn_i, ei_i, si_i = (
+                col["merge_name"],
+                col["team"],
+                col["db_season"],
+                col["espn_id"],
+                col["sleeper_id"],
+            )
+            width = max(mn_i, tm_i, sn_i, ei_i, si_i) + 1
             for row in reader:
-                mn = _merge_name(row.get("merge_name") or "")
+                if len(row) < width:
+                    row += [""] * (width - len(row))
+                mn = _merge_name(row[mn_i])
                 if not mn:
                     continue
-                tn = str(row.get("team") or "").strip().upper()
-                season = _season_num(row.get("db_season"))
-                espn = _clean_id(row.get("espn_id"))
-                sleeper = _clean_id(row.get("sleeper_id"))
-
-                _upsert_best(by_name_team_s, (mn, tn), season, espn, sleeper)
-                _upsert_best(by_name_s, mn, season, espn, sleeper)
-
-                last = mn.split(" ")[-1] if mn else ""
-                if last:
-                    _upsert_best(by_last_team_s, (last, tn), season, espn, sleeper)
-                    _upsert_best(by_last_s, last, season, espn, sleeper)
+                rows.append(
+                    (
+                        _season_num(row[sn_i]),
+                        mn,
+                        row[tm_i].strip().upper(),
+                        _headshot_url(_clean_id(row[ei_i]), _clean_id(row[si_i])),
+                    )
+                )
     except Exception:
         return None
 
-    by_name_team = {k: (v[1], v[2]) for k, v in by_name_team_s.items()}
-    by_name = {k: (v[1], v[2]) for k, v in by_name_s.items()}
-    by_last_team = {k: (v[1], v[2]) for k, v in by_last_team_s.items()}
-    by_last = {k: (v[1], v[2]) for k, v in by_last_s.items()}
-    return by_name_team, by_name, by_last_team, by_last
+    # One stable sort newest-first (ties keep file order), then reverse it so the dict(zip(...)) builds
+    # below -- last write wins -- keep exactly the first newest-first row per key, without a Python loop.
+    rows.sort(key=itemgetter(0), reverse=True)
+    rows.reverse()
+    if not rows:
+        return {}
+    _, names, teams, urls = zip(*rows)
+    # merge names are non-empty and space-normalized, so the last token is never empty.
+    lasts = [mn.rsplit(" ", 1)[-1] for mn in names]
+
+    # The kinds never share keys, so each update keeps its own last-write-wins semantics.
+    photo_map: PhotoMap = dict(zip(zip(repeat(_BY_NAME_TEAM), names, teams), urls))
+    photo_map.update(zip(zip(repeat(_BY_NAME), names, repeat("")), urls))
+    photo_map.update(zip(zip(repeat(_BY_LAST_TEAM), lasts, teams), urls))
+    photo_map.update(zip(zip(repeat(_BY_LAST), lasts, repeat("")), urls))
+    return photo_map
 
 
 def _uniq_sorted_int(vals: list[Any], *, desc: bool = False) -> list[int]:
-    out: list[int] = []
-    seen = set()
-    for v in vals:
-        try:
-            i = int(v)
-        except Exception:
-            continue
-        if i in seen:
-            continue
-        seen.add(i)
-        out.append(i)
-    return sorted(out, reverse=desc)
+    # JSON ints pass straight through; anything else gets the usual lenient coercion.
+    ints = (v if type(v) is int else _safe_int(v) for v in vals)
+    if np is None:
+        return sorted({i for i in ints if i is not None}, reverse=desc)
+    # np.unique sorts + dedupes in C (seasons/weeks come back as up to 5000 game rows).
+    u = np.unique(np.fromiter((i for i in ints if i is not None), dtype=np.int64))
+    return (u[::-1] if desc else u).tolist()
+
+
+def _team_totals(teams: list[str], values: list[int]) -> list[float]:
+    # Each row's team total of `values`, in row order (a groupby-sum broadcast back to the rows).
+    if np is None:
+        totals: dict[str, int] = {}
+        for t, v in zip(teams, values):
+            totals[t] = totals.get(t, 0) + v
+        return [totals[t] for t in teams]
+    codes_by_team: dict[str, int] = {}
+    codes = np.fromiter((codes_by_team.setdefault(t, len(codes_by_team)) for t in teams), dtype=np.int64, count=len(teams))
+    vals = np.asarray(values, dtype=np.float64)
+    return np.bincount(codes, weights=vals, minlength=len(codes_by_team))[codes].tolist()
+
+
+def _share(value: int, total: float) -> Optional[float]:
+    # Only evaluated for returned rows; None when the team total is 0.
+    return (float(value) / float(total)) if total else None
+
+
+def _top_indices(keys: list[int], k: int) -> list[int]:
+    # Indices of the k largest keys, ties kept in input order (same as a stable sort(reverse=True)).
+    if np is None:
+        # nlargest(key=...) is documented as sorted(..., reverse=True)[:k], but O(n log k).
+        return heapq.nlargest(k, range(len(keys)), key=keys.__getitem__)
+    return np.argsort(-np.asarray(keys, dtype=np.int64), kind="stable")[:k].tolist()
+
+
+# Leaderboards never return more than this many rows (the frontend relies on the cap too).
+_MAX_LEADERBOARD_ROWS = 200
+
+
+def _top_k(limit: int) -> int:
+    return 1 if limit < 1 else (_MAX_LEADERBOARD_ROWS if limit > _MAX_LEADERBOARD_ROWS else limit)
+
+
+def _select_pages(
+    sb: SupabaseClient, table: str, *, page_size: int, limit: int, **kwargs: Any
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield up to `limit` rows from sb.select, one Range page at a time.
+
+    PostgREST deployments cap a single response (Supabase defaults to 1000 rows), so big reads page
+    explicitly; only one page of decoded rows is alive at a time. `order` must be a total order.
+    """
+    offset = 0
+    while offset < limit:
+        size = min(page_size, limit - offset)
+        page = sb.select(table, limit=size, offset=offset, **kwargs)
+        yield from page
+        if len(page) < size:
+            return
+        offset += size
+
 
+def _full_name(first: Any, last: Any, pid: Any) -> str:
+    # "First Last" from trimmed parts, falling back to the player id when both are blank.
+    first = str(first or "").strip()
+    last = str(last or "").strip()
+    if first and last:
+        return f"{first} {last}"
+    return first or last or str(pid)
 
-def _in_list(values: list[int]) -> str:
-    inner = ",".join(str(int(v)) for v in values)
-    return f"in.({inner})"
 
 def _safe_int(x: Any) -> Optional[int]:
+    # JSON ints/None (nearly every value from PostgREST) return before any conversion.
+    if x is None:
+        return None
+    if type(x) is int:
+        return x
+    if x == "":
+        return None
     try:
-        if x is None or x == "":
-            return None
         return int(x)
-    except Exception:
+    except (TypeError, ValueError, OverflowError):
         return None
 
 
+# Integer columns of a players-list season row, in the order _player_rows unpacks them.
+_SEASON_INT_FIELDS = (
+    "games_played",
+    "receiving_targets",
+    "receptions",
+    "receiving_yards",
+    "receiving_touchdowns",
+    "rushing_attempts",
+    "rushing_yards",
+    "rushing_touchdowns",
+    "passing_attempts",
+    "passing_completions",
+    "passing_yards",
+    "passing_touchdowns",
+    "passing_interceptions",
+)
+
+
+def _int_fields(row: dict[str, Any], fields: tuple[str, ...]) -> list[int]:
+    # Same as `_safe_int(row.get(f)) or 0` per field; JSON ints (the common case) skip the coercion call.
+    return [v if type(v) is int else (_safe_int(v) or 0) for v in map(row.get, fields)]
+
+
 def _safe_float(x: Any) -> Optional[float]:
+    if x is None:
+        return None
+    if type(x) is float:
+        return x
+    if x == "":
+        return None
     try:
-        if x is None or x == "":
-            return None
         return float(x)
-    except Exception:
+    except (TypeError, ValueError, OverflowError):
         return None
 
 
-def _team_map(sb: SupabaseClient, team_ids: list[int]) -> dict[int, str]:
-    team_map: dict[int, str] = {}
-    if not team_ids:
-        return team_map
-    teams = sb.select("nfl_teams", select="id,abbreviation", filters={"id": _in_list(team_ids)}, limit=len(team_ids))
-    for t in teams:
-        try:
-            team_map[int(t["id"])] = str(t.get("abbreviation") or "").upper()
-        except Exception:
+TeamMaps = tuple[dict[int, str], dict[str, int]]
+# Teams almost never change, but refetch hourly so a relocation/abbreviation fix shows up without a restart.
+_TEAM_LOOKUP_TTL_SECONDS = 3600.0
+_TEAM_LOOKUP_MAXSIZE = 8
+_TEAM_LOOKUP_CACHE: dict[Any, tuple[float, TeamMaps]] = {}
+_TEAM_LOOKUP_LOCK = threading.Lock()
+
+
+def _team_lookup(sb: SupabaseClient) -> TeamMaps:
+    """
+    Fetch the (static, ~32 row) nfl_teams table once per client per _TEAM_LOOKUP_TTL_SECONDS.
+
+    Returns (id -> abbreviation, abbreviation -> id). Keyed on the client object so test stubs
+    and the long-lived server client each get their own cached copy.
+    """
+    now = time.monotonic()
+    with _TEAM_LOOKUP_LOCK:
+        hit = _TEAM_LOOKUP_CACHE.get(sb)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    maps = _fetch_team_maps(sb)
+    with _TEAM_LOOKUP_LOCK:
+        _TEAM_LOOKUP_CACHE.pop(sb, None)
+        _TEAM_LOOKUP_CACHE[sb] = (now + _TEAM_LOOKUP_TTL_SECONDS, maps)
+        while len(_TEAM_LOOKUP_CACHE) > _TEAM_LOOKUP_MAXSIZE:
+            _TEAM_LOOKUP_CACHE.pop(next(iter(_TEAM_LOOKUP_CACHE)))
+    return maps
+
+
+def _fetch_team_maps(sb: SupabaseClient) -> TeamMaps:
+    by_id: dict[int, str] = {}
+    by_abbr: dict[str, int] = {}
+    for t in sb.select("nfl_teams", select="id,abbreviation", limit=64):
+        tid = _safe_int(t.get("id"))
+        abbr = str(t.get("abbreviation") or "").strip().upper()
+        if tid is None or not abbr:
             continue
-    return team_map
+        by_id[tid] = abbr
+        by_abbr[abbr] = tid
+    return by_id, by_abbr
+
+
+def _team_id_for_abbr(sb: SupabaseClient, abbr: Optional[str]) -> Optional[int]:
+    key = (abbr or "").strip().upper()
+    if not key:
+        return None
+    return _team_lookup(sb)[1].get(key)
+
+
+# Postgres/PostgREST error codes for an unknown relation or column (42P01/42703 from Postgres,
+# PGRST2xx when the schema cache doesn't know it).
+_MISSING_OBJECT_CODES = ("42P01", "42703", "PGRST200", "PGRST204", "PGRST205")
+# A missing view/column is re-probed after this long, so applying the migration needs no restart.
+_PROBE_NEGATIVE_TTL_SECONDS = 300.0
+_PROBE_CACHE: dict[tuple[Any, str, str], tuple[float, bool]] = {}
+
+
+def _is_missing_object(e: SupabaseError) -> bool:
+    if e.status_code == 404:
+        return True
+    return e.status_code == 400 and any(code in e.body for code in _MISSING_OBJECT_CODES)
+
+
+def _probe_exists(sb: SupabaseClient, table: str, column: str) -> bool:
+    """
+    Whether `table.column` is selectable, cached per client.
+
+    Only an explicit "does not exist" answer counts as absent (and is re-checked after a few minutes);
+    network errors and 5xx responses propagate instead of switching the fast paths off.
+    """
+    key = (sb, table, column)
+    now = time.monotonic()
+    hit = _PROBE_CACHE.get(key)
+    if hit is not None and hit[0] > now:
+        return hit[1]
+    try:
+        sb.select(table, select=column, limit=1)
+    except SupabaseError as e:
+        if not _is_missing_object(e):
+            raise
+        _PROBE_CACHE[key] = (now + _PROBE_NEGATIVE_TTL_SECONDS, False)
+        return False
+    _PROBE_CACHE[key] = (float("inf"), True)
+    return True
+
+
+_SEASON_VIEW = "mv_player_season_stats"
+
+
+def _has_season_view(sb: SupabaseClient) -> bool:
+    """
+    Probe for the optional season leaderboard view (supabase/mv_player_season_stats.sql).
+    Deployments that haven't applied it keep using the get_players_list + Python aggregation path.
+    """
+    return _probe_exists(sb, _SEASON_VIEW, "player_id")
+
+
+def _season_view_rows(
+    sb: SupabaseClient,
+    *,
+    season: int,
+    team: Optional[str],
+    select: str,
+    order: str,
+    limit: int,
+    filters: Optional[dict[str, Any]] = None,
+) -> Optional[list[dict[str, Any]]]:
+    """
+    Top-N season rows straight from the view (already joined, filtered and ordered server-side).
+    Returns None when the view isn't available so callers can fall back.
+    """
+    if not _has_season_view(sb):
+        return None
+    view_filters: dict[str, Any] = {"season": f"eq.{int(season)}", "postseason": "eq.false"}
+    if team:
+        tid = _team_id_for_abbr(sb, team)
+        if tid is not None:
+            view_filters["team_id"] = f"eq.{tid}"
+    if filters:
+        view_filters.update(filters)
+    return sb.select(
+        _SEASON_VIEW,
+        select="player_id,first_name,last_name,position,team," + select,
+        filters=view_filters,
+        order=f"{order},player_id.asc",
+        limit=_top_k(limit),
+    )
+
+
+def _season_view_identity(r: dict[str, Any]) -> tuple[str, str, Optional[str], str]:
+    # (player_id, player_name, team, position) in the same shape get_players_list produces.
+    pid = str(r.get("player_id"))
+    name = _full_name(r.get("first_name"), r.get("last_name"), pid)
+    return pid, name, r.get("team") or None, r.get("position") or "UNK"
+
+
+# Leaderboard responses are read-heavy and only change when the ingest runs, so keep them in-process
+# for a few minutes (past seasons effectively never change). Keyed on the client object, like _team_lookup.
+# Ingest runs in its own process and can't reach this cache, so new stats show up once the entry
+# expires: up to _DASHBOARD_TTL_SECONDS for the current season, _HISTORICAL_TTL_SECONDS for past ones.
+_DASHBOARD_CACHE: dict[tuple[Any, ...], tuple[float, list[dict[str, Any]]]] = {}
+_DASHBOARD_CACHE_LOCK = threading.Lock()
+_DASHBOARD_CACHE_MAXSIZE = 512
+_DASHBOARD_TTL_SECONDS = 300.0
+_HISTORICAL_TTL_SECONDS = 86400.0
+
+
+def _current_nfl_season(today: Optional[date] = None) -> int:
+    d = today or date.today()
+    # Jan/Feb games (playoffs) belong to the season that started the previous September.
+    return d.year if d.month >= 3 else d.year - 1
+
+
+def _dashboard_ttl(season: Any) -> float:
+    s = _safe_int(season)
+    if s is not None and s < _current_nfl_season():
+        return _HISTORICAL_TTL_SECONDS
+    return _DASHBOARD_TTL_SECONDS
+
+
+def clear_dashboard_cache() -> None:
+    """
+    Drop all cached leaderboard responses and the team table held by this process.
+
+    The server never calls this (it can't see ingest writes); it's for tests and interactive sessions.
+    """
+    with _DASHBOARD_CACHE_LOCK:
+        _DASHBOARD_CACHE.clear()
+    with _TEAM_LOOKUP_LOCK:
+        _TEAM_LOOKUP_CACHE.clear()
+
+
+def _cached_dashboard(fn: Callable[..., list[dict[str, Any]]]) -> Callable[..., list[dict[str, Any]]]:
+    @wraps(fn)
+    def wrapper(sb: SupabaseClient, **kwargs: Any) -> list[dict[str, Any]]:
+        key = (fn.__name__, sb, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with _DASHBOARD_CACHE_LOCK:
+            hit = _DASHBOARD_CACHE.get(key)
+        if hit is not None and hit[0] > now:
+            return list(hit[1])
+        rows = fn(sb, **kwargs)
+        with _DASHBOARD_CACHE_LOCK:
+            _DASHBOARD_CACHE.pop(key, None)
+            _DASHBOARD_CACHE[key] = (now + _dashboard_ttl(kwargs.get("season")), rows)
+            while len(_DASHBOARD_CACHE) > _DASHBOARD_CACHE_MAXSIZE:
+                _DASHBOARD_CACHE.pop(next(iter(_DASHBOARD_CACHE)))
+        return list(rows)
+
+    return wrapper
+
+
+_PASSING_OR_FILTER = "(passing_yards.gt.0,passing_attempts.gt.0,passing_touchdowns.gt.0)"
+
+
+def _has_column(sb: SupabaseClient, table: str, column: str) -> bool:
+    # Probe for optional generated columns (supabase/add_has_passing.sql, add_total_yards.sql).
+    return _probe_exists(sb, table, column)
+
+
+def _passing_rows_filter(sb: SupabaseClient, table: str) -> tuple[str, str]:
+    # Same row set either way; the boolean column lets Postgres use the partial indexes.
+    if _has_column(sb, table, "has_passing"):
+        return "has_passing", "eq.true"
+    return "or", _PASSING_OR_FILTER
+
+
+# Small shared pool for independent one-off lookups (column probes, team table) on a cold client.
+_LOOKUP_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sb-lookup")
+
+
+def _prefetch(*calls: Callable[[], Any]) -> None:
+    """
+    Run independent cached lookups concurrently, so a cold request waits for one round-trip
+    instead of several in a row. Once the caches are warm each call is just a dict hit.
+    """
+    if len(calls) < 2:
+        for call in calls:
+            call()
+        return
+    for fut in [_LOOKUP_POOL.submit(call) for call in calls]:
+        fut.result()
 
 
 def options(sb: SupabaseClient) -> dict[str, Any]:
     games = sb.select("nfl_games", select="season,week", order="season.desc,week.asc", limit=5000)
     seasons = _uniq_sorted_int([g.get("season") for g in games], desc=True)
     weeks = _uniq_sorted_int([g.get("week") for g in games], desc=False)
-    teams = sb.select("nfl_teams", select="abbreviation", order="abbreviation.asc", limit=1000)
-    team_abbr = [t.get("abbreviation") for t in teams if isinstance(t.get("abbreviation"), str)]
+    # The teams table is static; reuse the per-client lookup instead of another round-trip.
+    team_abbr = sorted(_team_lookup(sb)[1])
     positions = ["QB", "RB", "WR", "TE"]
     return {"seasons": seasons, "weeks": weeks, "teams": team_abbr, "positions": positions}
 
@@ -266,29 +612,81 @@ def summary(sb: SupabaseClient) -> dict[str, Any]:
     # Mirror the existing JSON shape expected by the React UI (it doesn't depend on most fields).
     return {"seasons": seasons, "games": games, "players": players, "teams": teams}
 
-def _has_any_stats(row: dict[str, Any]) -> bool:
-    # Player recorded at least one meaningful offensive stat.
-    # Important: some feeds may omit attempts/targets but still populate yards/TDs.
-    for k in (
-        # passing volume/production
-        "passing_attempts",
-        "passing_completions",
-        "passing_yards",
-        "passing_touchdowns",
-        # rushing volume/production
-        "rushing_attempts",
-        "rushing_yards",
-        "rushing_touchdowns",
-        # receiving volume/production
-        "receiving_targets",
-        "receptions",
-        "receiving_yards",
-        "receiving_touchdowns",
-    ):
-        v = _safe_int(row.get(k))
-        if v is not None and v > 0:
-            return True
-    return False
+
+def _position_scope_filter(pos_raw: str, allowed_positions: frozenset[str]) -> Optional[str]:
+    """
+    PostgREST `or=(...)` on nfl_players.position_abbreviation that pre-filters rows the Python position
+    rules would drop anyway: NULL/empty positions are always kept, the default scope only drops
+    defense/special teams, and an explicit filter keeps just that position.
+    The Python checks stay in place (they also normalise case/whitespace); this only trims the payload.
+    """
+    if pos_raw in {"", "ALL"}:
+        keep = f"position_abbreviation.not.in.({','.join(sorted(_BLOCKED_POSITIONS))})"
+    else:
+        if not all(p.isalnum() for p in allowed_positions):
+            return None  # don't splice odd user input into the filter grammar
+        # Wildcards so padded values (" QB") still come back; the Python gate does the exact match.
+        keep = ",".join(f"position_abbreviation.ilike.*{p}*" for p in sorted(allowed_positions))
+    return f"(position_abbreviation.is.null,position_abbreviation.eq.,{keep})"
+
+
+def _position_scope(
+    position: Optional[str], default_scope: frozenset[str]
+) -> tuple[str, frozenset[str], Optional[str]]:
+    """
+    Normalise a dashboard's `position` argument into (pos_raw, allowed positions, nfl_players.or filter).
+    Blank/ALL uses the leaderboard's default scope, `HB` means `RB`, anything else is that one position.
+    """
+    pos_raw = (position or "").strip().upper()
+    if pos_raw in {"", "ALL"}:
+        allowed_positions = default_scope
+    elif pos_raw == "HB":
+        allowed_positions = _RB_POSITIONS
+    else:
+        allowed_positions = frozenset((pos_raw,))
+    return pos_raw, allowed_positions, _position_scope_filter(pos_raw, allowed_positions)
+
+
+def _scoped_game_rows(
+    stats: Iterable[dict[str, Any]], pos_raw: str, allowed_positions: frozenset[str]
+) -> Iterator[tuple[int, Optional[str], dict[str, Any], dict[str, Any]]]:
+    """
+    Shared position gate for the weekly dashboards: yields (player_id, position, row, embedded player) for
+    rows the leaderboard may show. NULL/UNK/empty positions pass (the stat filters already proved the
+    role); defense/special teams are blocked unless explicitly requested.
+    """
+    explicit = pos_raw not in {"", "ALL"}
+    for r in stats:
+        pid = _safe_int(r.get("player_id"))
+        if pid is None:
+            continue
+        p = r.get("nfl_players") or {}
+        pos = _norm_pos(p.get("position_abbreviation"))
+        if pos and pos not in allowed_positions and (explicit or pos in _BLOCKED_POSITIONS):
+            continue
+        yield pid, pos, r, p
+
+
+# Upper bound on rows scanned while refilling a ranked page (same as the unranked total-yards read).
+_SCOPED_SCAN_LIMIT = 5000
+
+
+def _scoped_top_rows(
+    sb: SupabaseClient, table: str, *, k: int, pos_raw: str, allowed_positions: frozenset[str], **kwargs: Any
+) -> list[tuple[int, Optional[str], dict[str, Any], dict[str, Any]]]:
+    """
+    First k rows (in the server's `order`) that pass _scoped_game_rows.
+
+    The PostgREST position filter can't trim or upper-case, so a few rows it keeps (e.g. "cb ") are
+    dropped by the Python gate; read further pages until k rows survive instead of returning a short page.
+    """
+    out: list[tuple[int, Optional[str], dict[str, Any], dict[str, Any]]] = []
+    pages = _select_pages(sb, table, page_size=k, limit=_SCOPED_SCAN_LIMIT, **kwargs)
+    for item in _scoped_game_rows(pages, pos_raw, allowed_positions):
+        out.append(item)
+        if len(out) >= k:
+            break
+    return out
 
 
 def _sanitize_search(q: Optional[str]) -> Optional[str]:
@@ -299,13 +697,45 @@ def _sanitize_search(q: Optional[str]) -> Optional[str]:
     s = (q or "").strip()
     if not s:
         return None
-    s = re.sub(r"[^a-zA-Z0-9 ]+", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _SEARCH_STRIP_RE.sub(" ", s)
+    s = _SPACES_RE.sub(" ", s).strip()
     if len(s) < 2:
         return None
     return s
 
 
+class _PlayerRow(NamedTuple):
+    # One players-list row. Field names are the JSON keys of /api/players (photoUrl is added on output).
+    player_id: str
+    player_name: str
+    team: Optional[str]
+    position: str
+    season: int
+    games: int
+    targets: int
+    receptions: int
+    receivingYards: int
+    receivingTouchdowns: int
+    avgYardsPerCatch: float
+    rushAttempts: int
+    rushingYards: int
+    rushingTouchdowns: int
+    avgYardsPerRush: float
+    passingAttempts: int
+    passingCompletions: int
+    passingYards: int
+    passingTouchdowns: int
+    passingInterceptions: int
+    qbRating: Optional[float]
+    qbr: Optional[float]
+
+
+def _player_row(row: _PlayerRow) -> dict[str, Any]:
+    out = row._asdict()
+    out["photoUrl"] = player_photo_url_from_name_team(name=row.player_name, team=row.team)
+    return out
+
+
 def get_players_list(
     sb: SupabaseClient,
     *,
@@ -322,31 +752,28 @@ def get_players_list(
     season stats for the requested season. Includes rookies like Dart/Egbuka who HAVE stats,
     but excludes practice squad players with no stats.
     """
+    rows = _player_rows(sb, season=season, position=position, team=team, q=q, limit=limit, offset=offset)
+    return [_player_row(row) for row in rows]
+
+
+def _player_rows(
+    sb: SupabaseClient,
+    *,
+    season: Optional[int],
+    position: Optional[str],
+    team: Optional[str],
+    q: Optional[str] = None,
+    limit: int,
+    offset: int = 0,
+) -> list[_PlayerRow]:
+    # Same rows as get_players_list, kept as named tuples: the season fallbacks read them directly,
+    # and only the returned page ever becomes dicts.
     if season is None:
         return []
 
-    # Defensive/special teams positions to BLOCK
-    blocked_positions = {"DB", "CB", "S", "SS", "FS", "LB", "ILB", "OLB", "DL", "DE", "DT", "NT", "OL", "OT", "OG", "C", "K", "P", "LS"}
-    
-    # Build filters for the INNER JOIN query
-    player_filters: dict[str, Any] = {}
-    
-    # Filter by team if specified
-    if team:
-        t = sb.select("nfl_teams", select="id", filters={"abbreviation": f"eq.{team}"}, limit=1)
-        if t:
-            team_id = _safe_int(t[0].get("id"))
-            if team_id:
-                player_filters["team_id"] = f"eq.{team_id}"
     
     # Text search on name
     needle = _sanitize_search(q)
-    if needle:
-        player_filters["or"] = f"(first_name.ilike.*{needle}*,last_name.ilike.*{needle}*)"
-    
-    # CRITICAL: Filter stats by season (PostgREST foreign table filter syntax)
-    player_filters["nfl_player_season_stats.season"] = f"eq.{int(season)}"
-    player_filters["nfl_player_season_stats.postseason"] = "eq.false"
     
     # STRATEGY: Query from nfl_player_season_stats (ordered by passing_yards desc)
     # This ensures we get the TOP players, not just alphabetically first 1000
@@ -357,27 +784,28 @@ def get_players_list(
     stats_filters: dict[str, Any] = {
         "season": f"eq.{int(season)}",
         "postseason": "eq.false",
+        # Defense/special teams are dropped below anyway; don't download them.
+        "nfl_players.or": _position_scope_filter("", frozenset()),
     }
     
     # Build embed filter for nfl_players (team + name search)
     embed_filters = []
     if team:
-        t = sb.select("nfl_teams", select="id", filters={"abbreviation": f"eq.{team}"}, limit=1)
-        if t:
-            team_id = _safe_int(t[0].get("id"))
-            if team_id:
-                embed_filters.append(f"team_id.eq.{team_id}")
+        team_id = _team_id_for_abbr(sb, team)
+        if team_id:
+            embed_filters.append(f"team_id.eq.{team_id}")
     if needle:
         embed_filters.append(f"or(first_name.ilike.*{needle}*,last_name.ilike.*{needle}*)")
     
     embed_filter_str = ",".join(embed_filters) if embed_filters else ""
     
-    # Request many rows; Supabase will cap at ~1000
+    # Request many rows; Supabase caps each response at ~1000, so read them in pages.
     req_limit = 5000
-    req_offset = 0
     
-    # Query from stats table, embed players, order by passing_yards (gets QBs first, which is fine)
-    stats_rows = sb.select(
+    # Query from stats table, embed players, order by passing_yards (gets QBs first, which is fine).
+    # player_id breaks ties so pages never overlap; rows are consumed as each page arrives.
+    stats_rows = _select_pages(
+        sb,
         "nfl_player_season_stats",
         select=(
             "player_id,games_played,"
@@ -388,57 +816,38 @@ def get_players_list(
             f"nfl_players!inner({embed_filter_str if embed_filter_str else ''}id,first_name,last_name,position_abbreviation,team_id,nfl_teams(abbreviation))"
         ),
         filters=stats_filters,
-        order="passing_yards.desc.nullslast",
+        order="passing_yards.desc.nullslast,player_id.asc",
+        page_size=1000,
         limit=req_limit,
-        offset=req_offset,
     )
     
-    # Restructure: convert stats-centric rows to player-centric
-    players = []
-    for stat_row in stats_rows:
-        player_obj = stat_row.get("nfl_players")
-        if not player_obj:
-            continue
-        # Merge stats into player object
-        player_obj["nfl_player_season_stats"] = [stat_row]
-        players.append(player_obj)
-    
-    
     # Process players with PYTHON-SIDE DEFENSIVE BLOCKING
-    out: list[dict[str, Any]] = []
+    ranked: list[tuple[int, _PlayerRow]] = []
     pos_filter = (position or "").strip().upper()
     
-    for p in players:
+    # Rows are stats-centric: each one is a season-stats row with its player embedded.
+    for stats in stats_rows:
+        p = stats.get("nfl_players")
+        if not p:
+            continue
         pid = _safe_int(p.get("id"))
         if not pid:
             continue
         
-        pos = (p.get("position_abbreviation") or "").strip().upper() or None
-
-        # Extract stats from embedded table (INNER JOIN guarantees at least one row)
-        stats_list = p.get("nfl_player_season_stats") or []
-        stats = stats_list[0] if stats_list else {}
-
-        games = _safe_int(stats.get("games_played")) or 0
-        targets = _safe_int(stats.get("receiving_targets")) or 0
-        rec = _safe_int(stats.get("receptions")) or 0
-        rec_yards = _safe_int(stats.get("receiving_yards")) or 0
-        rec_tds = _safe_int(stats.get("receiving_touchdowns")) or 0
-        rush_att = _safe_int(stats.get("rushing_attempts")) or 0
-        rush_yards = _safe_int(stats.get("rushing_yards")) or 0
-        rush_tds = _safe_int(stats.get("rushing_touchdowns")) or 0
-        pass_att = _safe_int(stats.get("passing_attempts")) or 0
-        pass_cmp = _safe_int(stats.get("passing_completions")) or 0
-        pass_yds = _safe_int(stats.get("passing_yards")) or 0
-        pass_tds = _safe_int(stats.get("passing_touchdowns")) or 0
-        pass_int = _safe_int(stats.get("passing_interceptions")) or 0
+        pos = _norm_pos(p.get("position_abbreviation"))
+
+        (
+            games, targets, rec, rec_yards, rec_tds,
+            rush_att, rush_yards, rush_tds,
+            pass_att, pass_cmp, pass_yds, pass_tds, pass_int,
+        ) = _int_fields(stats, _SEASON_INT_FIELDS)
         qb_rating = _safe_float(stats.get("qb_rating"))
         qbr = _safe_float(stats.get("qbr"))
 
         # Position Filtering (Defense Blocker)
         # Special case: some feeds leave rookies as NULL/UNK/ROOKIE in nfl_players even though stats prove role.
-        is_unknown_pos = (not pos) or (pos in {"UNK", "UNKNOWN", "NULL", "ROOKIE"})
-        if pos in blocked_positions:
+        is_unknown_pos = (not pos) or (pos in _UNKNOWN_POSITIONS)
+        if pos in _BLOCKED_POSITIONS:
             continue  # Defensive/special teams
 
         if pos_filter:
@@ -460,44 +869,37 @@ def get_players_list(
                     # Unknown filter value; be strict.
                     continue
 
-        # Build player dict
-        first = (p.get("first_name") or "").strip()
-        last = (p.get("last_name") or "").strip()
-        name = (first + " " + last).strip() or str(pid)
+        # Build player row (a named tuple; dicts are only materialized for the returned page)
+        name = _full_name(p.get("first_name"), p.get("last_name"), pid)
         
         team_obj = p.get("nfl_teams") or {}
         team_abbr = team_obj.get("abbreviation") or None
         
         avg_ypc = (float(rec_yards) / float(rec)) if rec else 0.0
         avg_ypr = (float(rush_yards) / float(rush_att)) if rush_att else 0.0
-        photo = player_photo_url_from_name_team(name=name, team=team_abbr)
+
+        # Sort by position-specific primary yards (QB: passing, RB: rushing, WR/TE: receiving)
+        if pos == "QB":
+            primary_yds = pass_yds
+        elif pos in {"RB", "HB"}:
+            primary_yds = rush_yards
+        elif pos in {"WR", "TE"}:
+            primary_yds = rec_yards
+        else:
+            # Unknown position: use total yards
+            primary_yds = pass_yds + rush_yards + rec_yards
         
-        out.append(
-            {
-                "player_id": str(pid),
-                "player_name": name,
-                "team": team_abbr,
-                "position": pos or "UNK",
-                "season": season,
-                "games": games,
-                "targets": targets,
-                "receptions": rec,
-                "receivingYards": rec_yards,
-                "receivingTouchdowns": rec_tds,
-                "avgYardsPerCatch": avg_ypc,
-                "rushAttempts": rush_att,
-                "rushingYards": rush_yards,
-                "rushingTouchdowns": rush_tds,
-                "avgYardsPerRush": avg_ypr,
-                "passingAttempts": pass_att,
-                "passingCompletions": pass_cmp,
-                "passingYards": pass_yds,
-                "passingTouchdowns": pass_tds,
-                "passingInterceptions": pass_int,
-                "qbRating": qb_rating,
-                "qbr": qbr,
-                "photoUrl": photo,
-            }
+        ranked.append(
+            (
+                primary_yds,
+                _PlayerRow(
+                    str(pid), name, team_abbr, pos or "UNK", season, games,
+                    targets, rec, rec_yards, rec_tds, avg_ypc,
+                    rush_att, rush_yards, rush_tds, avg_ypr,
+                    pass_att, pass_cmp, pass_yds, pass_tds, pass_int,
+                    qb_rating, qbr,
+                ),
+            )
         )
     
     # DON'T break early! We must process ALL fetched players before sorting/slicing
@@ -505,29 +907,11 @@ def get_players_list(
     
     if needle:
         # Keep name order for search results; slice to requested limit.
-        return out[:safe_limit]
-
-    # Sort by position-specific primary yards (QB: passing, RB: rushing, WR/TE: receiving)
-    def sort_key(r: dict[str, Any]) -> int:
-        pos = (r.get("position") or "").strip().upper()
-        pass_yds = int(r.get("passingYards") or 0)
-        rush_yds = int(r.get("rushingYards") or 0)
-        rec_yds = int(r.get("receivingYards") or 0)
-        
-        if pos == "QB":
-            return pass_yds
-        elif pos in {"RB", "HB"}:
-            return rush_yds
-        elif pos in {"WR", "TE"}:
-            return rec_yds
-        else:
-            # Unknown position: use total yards
-            return pass_yds + rush_yds + rec_yds
-
-    out.sort(key=sort_key, reverse=True)
-    start = safe_offset
-    end = safe_offset + safe_limit
-    return out[start:end]
+        page = ranked[:safe_limit]
+    else:
+        # Only offset+limit rows are ever returned; nlargest(key=...) matches a stable reverse sort.
+        page = heapq.nlargest(safe_offset + safe_limit, ranked, key=itemgetter(0))[safe_offset:]
+    return [row for _, row in page]
 
 
 def get_player_game_logs(
@@ -549,6 +933,7 @@ def get_player_game_logs(
     if not include_postseason:
         filters["postseason"] = "eq.false"
 
+    # Embed the game row; team abbreviations come from the cached teams table (no per-row team joins).
     rows = sb.select(
         "nfl_player_game_stats",
         select=(
@@ -556,7 +941,8 @@ def get_player_game_logs(
             "rushing_attempts,rushing_yards,rushing_touchdowns,"
             "receptions,receiving_yards,receiving_touchdowns,receiving_targets,"
             "passing_attempts,passing_completions,passing_yards,passing_touchdowns,passing_interceptions,"
-            "qbr,qb_rating"
+            "qbr,qb_rating,"
+            "nfl_games(home_team_id,visitor_team_id,postseason)"
         ),
         filters=filters,
         order="week.asc",
@@ -564,49 +950,21 @@ def get_player_game_logs(
     )
     if not rows:
         return []
-
-    game_ids = sorted({int(r["game_id"]) for r in rows if r.get("game_id") not in (None, "")})
-    games = sb.select(
-        "nfl_games",
-        select="id,home_team_id,visitor_team_id,postseason",
-        filters={"id": _in_list(game_ids)},
-        limit=len(game_ids),
-    )
-    game_map: dict[int, dict[str, Any]] = {}
-    team_ids = set()
-    for g in games:
-        gid = _safe_int(g.get("id"))
-        if gid is None:
-            continue
-        game_map[gid] = g
-        ht = _safe_int(g.get("home_team_id"))
-        vt = _safe_int(g.get("visitor_team_id"))
-        if ht is not None:
-            team_ids.add(ht)
-        if vt is not None:
-            team_ids.add(vt)
-
-    # Also include player's team_id values for mapping to abbreviation.
-    for r in rows:
-        tid = _safe_int(r.get("team_id"))
-        if tid is not None:
-            team_ids.add(tid)
-
-    tmap = _team_map(sb, sorted(team_ids))
+    team_abbr_by_id = _team_lookup(sb)[0]
 
     out: list[dict[str, Any]] = []
     for r in rows:
         gid = _safe_int(r.get("game_id"))
         if gid is None:
             continue
-        g = game_map.get(gid, {})
+        g = r.get("nfl_games") or {}
         ht = _safe_int(g.get("home_team_id"))
         vt = _safe_int(g.get("visitor_team_id"))
         tid = _safe_int(r.get("team_id"))
 
-        team_abbr = tmap.get(tid) if tid is not None else None
-        home_abbr = tmap.get(ht) if ht is not None else None
-        away_abbr = tmap.get(vt) if vt is not None else None
+        team_abbr = team_abbr_by_id.get(tid)
+        home_abbr = team_abbr_by_id.get(ht)
+        away_abbr = team_abbr_by_id.get(vt)
 
         location = "home"
         opp = None
@@ -655,6 +1013,7 @@ def get_player_game_logs(
     return out
 
 
+@_cached_dashboard
 def receiving_dashboard(
     sb: SupabaseClient,
     *,
@@ -673,16 +1032,18 @@ def receiving_dashboard(
         "or": "(receiving_yards.gt.0,receiving_targets.gt.0,receptions.gt.0,receiving_touchdowns.gt.0)",
     }
     if team:
-        t = sb.select("nfl_teams", select="id", filters={"abbreviation": f"eq.{team}"}, limit=1)
-        tid = _safe_int(t[0].get("id")) if t else None
+        tid = _team_id_for_abbr(sb, team)
         if tid is not None:
             filters["team_id"] = f"eq.{tid}"
+    pos_raw, allowed_positions, pos_scope = _position_scope(position, _RECEIVING_POSITIONS)
+    if pos_scope:
+        filters["nfl_players.or"] = pos_scope
     # Use PostgREST embedding to avoid extra round-trips for player/team hydration.
     stats = sb.select(
         "nfl_player_game_stats",
         select=(
-            "player_id,team_id,season,week,receiving_targets,receptions,receiving_yards,receiving_touchdowns,"
-            "nfl_players(first_name,last_name,position_abbreviation),"
+            "player_id,receiving_targets,receptions,receiving_yards,receiving_touchdowns,"
+            "nfl_players!inner(first_name,last_name,position_abbreviation),"
             "nfl_teams(abbreviation)"
         ),
         filters=filters,
@@ -690,36 +1051,13 @@ def receiving_dashboard(
         limit=500,
     )
 
-    pos_raw = (position or "").strip().upper()
-    if pos_raw in {"", "ALL"}:
-        allowed_positions = {"WR", "TE", "RB"}
-    elif pos_raw == "HB":
-        allowed_positions = {"RB"}
-    else:
-        allowed_positions = {pos_raw}
-
-    # Defensive/special teams positions to exclude (unless user explicitly filters for them)
-    blocked_positions = {"DB", "CB", "S", "SS", "FS", "LB", "ILB", "OLB", "DL", "DE", "DT", "NT", "OL", "OT", "OG", "C", "K", "P", "LS"}
-
     out = []
-    for r in stats:
-        pid = _safe_int(r.get("player_id"))
-        if pid is None:
-            continue
-        p = r.get("nfl_players") or {}
-        pos = (p.get("position_abbreviation") or "").strip().upper() or None
-        
-        # Allow NULL/UNK/empty positions if they have receiving stats (already filtered by query)
-        # But block defensive/special teams positions unless explicitly requested
-        if pos and pos not in allowed_positions:
-            # If user filtered for specific position, skip mismatches
-            if pos_raw not in {"", "ALL"} or pos in blocked_positions:
-                continue
+    for pid, pos, r, p in _scoped_game_rows(stats, pos_raw, allowed_positions):
         targets = _safe_int(r.get("receiving_targets")) or 0
         rec = _safe_int(r.get("receptions")) or 0
         rec_y = _safe_int(r.get("receiving_yards")) or 0
         rec_td = _safe_int(r.get("receiving_touchdowns")) or 0
-        name = (str(p.get("first_name") or "").strip() + " " + str(p.get("last_name") or "").strip()).strip() or str(pid)
+        name = _full_name(p.get("first_name"), p.get("last_name"), pid)
         t = r.get("nfl_teams") or {}
         team_abbr = (t.get("abbreviation") or None)
         out.append(
@@ -741,11 +1079,13 @@ def receiving_dashboard(
         )
     
     # FORCE SORT by receiving yards descending to fix ordering issues
-    out.sort(key=lambda x: (x.get('rec_yards') or 0), reverse=True)
+    # (every row is returned here, so this stays a full sort).
+    out.sort(key=itemgetter("rec_yards"), reverse=True)
     
     return out
 
 
+@_cached_dashboard
 def rushing_dashboard(
     sb: SupabaseClient,
     *,
@@ -762,15 +1102,17 @@ def rushing_dashboard(
         "or": "(rushing_yards.gt.0,rushing_attempts.gt.0,rushing_touchdowns.gt.0)",
     }
     if team:
-        t = sb.select("nfl_teams", select="id", filters={"abbreviation": f"eq.{team}"}, limit=1)
-        tid = _safe_int(t[0].get("id")) if t else None
+        tid = _team_id_for_abbr(sb, team)
         if tid is not None:
             filters["team_id"] = f"eq.{tid}"
+    pos_raw, allowed_positions, pos_scope = _position_scope(position, _RUSHING_POSITIONS)
+    if pos_scope:
+        filters["nfl_players.or"] = pos_scope
     stats = sb.select(
         "nfl_player_game_stats",
         select=(
-            "player_id,team_id,season,week,rushing_attempts,rushing_yards,rushing_touchdowns,receptions,receiving_yards,"
-            "nfl_players(first_name,last_name,position_abbreviation),"
+            "player_id,rushing_attempts,rushing_yards,rushing_touchdowns,receptions,receiving_yards,"
+            "nfl_players!inner(first_name,last_name,position_abbreviation),"
             "nfl_teams(abbreviation)"
         ),
         filters=filters,
@@ -778,32 +1120,9 @@ def rushing_dashboard(
         limit=500,
     )
 
-    pos_raw = (position or "").strip().upper()
-    if pos_raw in {"", "ALL"}:
-        allowed_positions = {"RB", "QB", "WR", "TE"}
-    elif pos_raw == "HB":
-        allowed_positions = {"RB"}
-    else:
-        allowed_positions = {pos_raw}
-
-    # Defensive/special teams positions to exclude (unless user explicitly filters for them)
-    blocked_positions = {"DB", "CB", "S", "SS", "FS", "LB", "ILB", "OLB", "DL", "DE", "DT", "NT", "OL", "OT", "OG", "C", "K", "P", "LS"}
-
     out = []
-    for r in stats:
-        pid = _safe_int(r.get("player_id"))
-        if pid is None:
-            continue
-        p = r.get("nfl_players") or {}
-        name = (str(p.get("first_name") or "").strip() + " " + str(p.get("last_name") or "").strip()).strip() or str(pid)
-        pos = (p.get("position_abbreviation") or "").strip().upper() or None
-        
-        # Allow NULL/UNK/empty positions if they have rushing stats (already filtered by query)
-        # But block defensive/special teams positions unless explicitly requested
-        if pos and pos not in allowed_positions:
-            # If user filtered for specific position, skip mismatches
-            if pos_raw not in {"", "ALL"} or pos in blocked_positions:
-                continue
+    for pid, pos, r, p in _scoped_game_rows(stats, pos_raw, allowed_positions):
+        name = _full_name(p.get("first_name"), p.get("last_name"), pid)
         t = r.get("nfl_teams") or {}
         team_abbr = (t.get("abbreviation") or None)
         rush_att = _safe_int(r.get("rushing_attempts")) or 0
@@ -830,11 +1149,13 @@ def rushing_dashboard(
         )
     
     # FORCE SORT by rushing yards descending to fix ordering issues
-    out.sort(key=lambda x: (x.get('rush_yards') or 0), reverse=True)
+    # (every row is returned here, so this stays a full sort).
+    out.sort(key=itemgetter("rush_yards"), reverse=True)
     
     return out
 
 
+@_cached_dashboard
 def receiving_season(
     sb: SupabaseClient,
     *,
@@ -843,47 +1164,71 @@ def receiving_season(
     q: Optional[str] = None,
     limit: int,
 ) -> list[dict[str, Any]]:
+    k = _top_k(limit)
     # Use season stats; team is best-effort (current team).
-    rows = get_players_list(sb, season=season, position=None, team=team, q=q, limit=8000)
+    if not _sanitize_search(q):
+        # The view's target share is over the whole team, which only matches the fallback without a name search.
+        view_rows = _season_view_rows(
+            sb,
+            season=season,
+            team=team,
+            select="receiving_targets,receptions,receiving_yards,receiving_touchdowns,team_target_share",
+            order="receiving_targets.desc.nullslast",
+            limit=k,
+        )
+        if view_rows is not None:
+            view_out = []
+            for r in view_rows:
+                pid, name, team_abbr, pos = _season_view_identity(r)
+                view_out.append(
+                    {
+                        "season": season,
+                        "team": team_abbr,
+                        "player_id": pid,
+                        "player_name": name,
+                        "position": pos,
+                        "targets": _safe_int(r.get("receiving_targets")) or 0,
+                        "receptions": _safe_int(r.get("receptions")) or 0,
+                        "rec_yards": _safe_int(r.get("receiving_yards")) or 0,
+                        "air_yards": 0,
+                        "rec_tds": _safe_int(r.get("receiving_touchdowns")) or 0,
+                        "team_target_share": _safe_float(r.get("team_target_share")),
+                        "photoUrl": player_photo_url_from_name_team(name=name, team=team_abbr),
+                    }
+                )
+            return view_out
+
+    rows = _player_rows(sb, season=season, position=None, team=team, q=q, limit=8000)
     # compute team target share within returned team scope
-    by_team: dict[str, int] = {}
-    for r in rows:
-        t = r.get("team") or ""
-        by_team[t] = by_team.get(t, 0) + int(r.get("targets") or 0)
-    # Defensive/special teams positions to exclude
-    blocked_positions = {"DB", "CB", "S", "SS", "FS", "LB", "ILB", "OLB", "DL", "DE", "DT", "NT", "OL", "OT", "OG", "C", "K", "P", "LS"}
-    
+    targets = [r.targets for r in rows]
+    team_totals = _team_totals([r.team or "" for r in rows], targets)
+    # Every position is eligible here: NULL/UNK positions come back as "UNK" and _player_rows has
+    # already dropped defensive/special teams, so there's no second filtering pass.
+
+    # Only the top rows are turned into response dicts.
     out = []
-    for r in rows:
-        pos = (r.get("position") or "").upper()
-        # Allow NULL/UNK/empty positions if they have receiving stats
-        # Block defensive/special teams positions
-        if pos and pos not in {"WR", "TE", "RB"}:
-            if pos in blocked_positions:
-                continue
-        t = r.get("team") or ""
-        denom = by_team.get(t, 0) or 0
-        share = (float(r.get("targets") or 0) / float(denom)) if denom else None
+    for i in _top_indices(targets, k):
+        r = rows[i]
         out.append(
             {
                 "season": season,
-                "team": r.get("team"),
-                "player_id": r.get("player_id"),
-                "player_name": r.get("player_name"),
-                "position": r.get("position"),
-                "targets": int(r.get("targets") or 0),
-                "receptions": int(r.get("receptions") or 0),
-                "rec_yards": int(r.get("receivingYards") or 0),
+                "team": r.team,
+                "player_id": r.player_id,
+                "player_name": r.player_name,
+                "position": r.position,
+                "targets": targets[i],
+                "receptions": r.receptions,
+                "rec_yards": r.receivingYards,
                 "air_yards": 0,
-                "rec_tds": int(r.get("receivingTouchdowns") or 0),
-                "team_target_share": share,
-                "photoUrl": player_photo_url_from_name_team(name=str(r.get("player_name") or ""), team=str(r.get("team") or "")),
+                "rec_tds": r.receivingTouchdowns,
+                "team_target_share": _share(targets[i], team_totals[i]),
+                "photoUrl": player_photo_url_from_name_team(name=r.player_name, team=r.team),
             }
         )
-    out.sort(key=lambda x: int(x.get("targets") or 0), reverse=True)
-    return out[: min(max(limit, 1), 200)]
+    return out
 
 
+@_cached_dashboard
 def rushing_season(
     sb: SupabaseClient,
     *,
@@ -893,51 +1238,95 @@ def rushing_season(
     q: Optional[str] = None,
     limit: int,
 ) -> list[dict[str, Any]]:
+    k = _top_k(limit)
     pos_raw = (position or "").strip().upper()
     pos_filter = None if pos_raw in {"", "ALL"} else ("RB" if pos_raw == "HB" else pos_raw)
 
-    rows = get_players_list(sb, season=season, position=pos_filter, team=team, q=q, limit=8000)
-    by_team: dict[str, int] = {}
-    for r in rows:
-        t = r.get("team") or ""
-        by_team[t] = by_team.get(t, 0) + int(r.get("rushAttempts") or 0)
+    if pos_filter is None and not _sanitize_search(q):
+        # The view's rush share is over the whole team, which only matches the fallback without position/name filters.
+        view_rows = _season_view_rows(
+            sb,
+            season=season,
+            team=team,
+            select=(
+                "games_played,rushing_attempts,rushing_yards,rushing_touchdowns,"
+                "receptions,receiving_yards,team_rush_share"
+            ),
+            order="rushing_yards.desc.nullslast",
+            limit=k,
+        )
+        if view_rows is not None:
+            view_out = []
+            for r in view_rows:
+                pid, name, team_abbr, pos = _season_view_identity(r)
+                games = _safe_int(r.get("games_played")) or 0
+                rush_att = _safe_int(r.get("rushing_attempts")) or 0
+                rush_y = _safe_int(r.get("rushing_yards")) or 0
+                rec = _safe_int(r.get("receptions")) or 0
+                rec_y = _safe_int(r.get("receiving_yards")) or 0
+                view_out.append(
+                    {
+                        "season": season,
+                        "team": team_abbr,
+                        "player_id": pid,
+                        "player_name": name,
+                        "position": pos,
+                        "games": games,
+                        "rush_attempts": rush_att,
+                        "rush_yards": rush_y,
+                        "rush_tds": _safe_int(r.get("rushing_touchdowns")) or 0,
+                        "ypc": (float(rush_y) / float(rush_att)) if rush_att else 0.0,
+                        "ypg": (float(rush_y) / float(games)) if games else 0.0,
+                        "receptions": rec,
+                        "rpg": (float(rec) / float(games)) if games else 0.0,
+                        "rec_yards": rec_y,
+                        "rec_ypg": (float(rec_y) / float(games)) if games else 0.0,
+                        "team_rush_share": _safe_float(r.get("team_rush_share")),
+                        "photoUrl": player_photo_url_from_name_team(name=name, team=team_abbr),
+                    }
+                )
+            return view_out
+
+    rows = _player_rows(sb, season=season, position=pos_filter, team=team, q=q, limit=8000)
+    # Position filtering already applied above when requested. Default includes all positions.
+    rush_atts = [r.rushAttempts for r in rows]
+    team_totals = _team_totals([r.team or "" for r in rows], rush_atts)
+    rush_yards = [r.rushingYards for r in rows]
+
+    # Only the top rows are turned into response dicts.
     out = []
-    for r in rows:
-        pos = (r.get("position") or "").upper()
-        # Position filtering already applied above when requested. Default includes all positions.
-        t = r.get("team") or ""
-        denom = by_team.get(t, 0) or 0
-        share = (float(r.get("rushAttempts") or 0) / float(denom)) if denom else None
-        games = int(r.get("games") or 0) or 0
-        rush_att = int(r.get("rushAttempts") or 0)
-        rush_y = int(r.get("rushingYards") or 0)
-        rec = int(r.get("receptions") or 0)
-        rec_y = int(r.get("receivingYards") or 0)
+    for i in _top_indices(rush_yards, k):
+        r = rows[i]
+        games = r.games
+        rush_att = rush_atts[i]
+        rush_y = rush_yards[i]
+        rec = r.receptions
+        rec_y = r.receivingYards
         out.append(
             {
                 "season": season,
-                "team": r.get("team"),
-                "player_id": r.get("player_id"),
-                "player_name": r.get("player_name"),
-                "position": r.get("position"),
+                "team": r.team,
+                "player_id": r.player_id,
+                "player_name": r.player_name,
+                "position": r.position,
                 "games": games,
                 "rush_attempts": rush_att,
                 "rush_yards": rush_y,
-                "rush_tds": int(r.get("rushingTouchdowns") or 0),
+                "rush_tds": r.rushingTouchdowns,
                 "ypc": (float(rush_y) / float(rush_att)) if rush_att else 0.0,
                 "ypg": (float(rush_y) / float(games)) if games else 0.0,
                 "receptions": rec,
                 "rpg": (float(rec) / float(games)) if games else 0.0,
                 "rec_yards": rec_y,
                 "rec_ypg": (float(rec_y) / float(games)) if games else 0.0,
-                "team_rush_share": share,
-                "photoUrl": player_photo_url_from_name_team(name=str(r.get("player_name") or ""), team=str(r.get("team") or "")),
+                "team_rush_share": _share(rush_att, team_totals[i]),
+                "photoUrl": player_photo_url_from_name_team(name=r.player_name, team=r.team),
             }
         )
-    out.sort(key=lambda x: int(x.get("rush_yards") or 0), reverse=True)
-    return out[: min(max(limit, 1), 200)]
+    return out
 
 
+@_cached_dashboard
 def passing_dashboard(
     sb: SupabaseClient,
     *,
@@ -947,81 +1336,68 @@ def passing_dashboard(
     position: Optional[str],
     limit: int,
 ) -> list[dict[str, Any]]:
+    k = _top_k(limit)
     filters: dict[str, Any] = {
         "season": f"eq.{int(season)}",
         "week": f"eq.{int(week)}",
         "postseason": "eq.false",
-        "or": "(passing_yards.gt.0,passing_attempts.gt.0,passing_touchdowns.gt.0)",
     }
     if team:
-        t = sb.select("nfl_teams", select="id", filters={"abbreviation": f"eq.{team}"}, limit=1)
-        tid = _safe_int(t[0].get("id")) if t else None
+        _prefetch(lambda: _has_column(sb, "nfl_player_game_stats", "has_passing"), lambda: _team_lookup(sb))
+    key, value = _passing_rows_filter(sb, "nfl_player_game_stats")
+    filters[key] = value
+    if team:
+        tid = _team_id_for_abbr(sb, team)
         if tid is not None:
             filters["team_id"] = f"eq.{tid}"
-    stats = sb.select(
+    pos_raw, allowed_positions, pos_scope = _position_scope(position, _QB_POSITIONS)
+    if pos_scope:
+        filters["nfl_players.or"] = pos_scope
+    # Use PostgREST embedding to avoid extra round-trips for player/team hydration.
+    # Ranked server-side; usually the first page is enough, later pages only refill rows the gate drops.
+    scoped = _scoped_top_rows(
+        sb,
         "nfl_player_game_stats",
-        select="player_id,team_id,season,week,passing_attempts,passing_completions,passing_yards,passing_touchdowns,passing_interceptions",
+        k=k,
+        pos_raw=pos_raw,
+        allowed_positions=allowed_positions,
+        select=(
+            "player_id,passing_attempts,passing_completions,passing_yards,passing_touchdowns,passing_interceptions,"
+            "nfl_players!inner(first_name,last_name,position_abbreviation),"
+            "nfl_teams(abbreviation)"
+        ),
         filters=filters,
-        limit=5000,
+        order="passing_yards.desc.nullslast,player_id.asc",
     )
-    # DON'T slice yet - need to filter by position first
-
-    pids = sorted({_safe_int(r.get("player_id")) for r in stats if _safe_int(r.get("player_id")) is not None})
-    players = sb.select("nfl_players", select="id,first_name,last_name,position_abbreviation", filters={"id": _in_list(pids)}, limit=len(pids))
-    pmap = {int(p["id"]): p for p in players if _safe_int(p.get("id")) is not None}
 
-    team_ids = sorted({_safe_int(r.get("team_id")) for r in stats if _safe_int(r.get("team_id")) is not None})
-    tmap = _team_map(sb, [t for t in team_ids if t is not None])
+    # First pass only keeps the sort key; dicts are built for the top rows.
+    ranked = [(_safe_int(r.get("passing_yards")) or 0, pid, pos, r, p) for pid, pos, r, p in scoped]
 
-    pos_raw = (position or "").strip().upper()
-    if pos_raw in {"", "ALL"}:
-        allowed_positions = {"QB"}
-    else:
-        allowed_positions = {pos_raw}
-    
-    # Defensive/special teams positions to exclude (unless user explicitly filters for them)
-    blocked_positions = {"DB", "CB", "S", "SS", "FS", "LB", "ILB", "OLB", "DL", "DE", "DT", "NT", "OL", "OT", "OG", "C", "K", "P", "LS"}
-    
+    # Top N by passing yards (nlargest with a key keeps input order on ties, like a stable sort).
     out = []
-    for r in stats:
-        pid = _safe_int(r.get("player_id"))
-        if pid is None:
-            continue
-        p = pmap.get(pid, {})
-        pos = (p.get("position_abbreviation") or "").strip().upper() or None
-        
-        # Allow NULL/UNK/empty positions if they have passing stats (already filtered by query)
-        # But block defensive/special teams positions unless explicitly requested
-        if pos and pos not in allowed_positions:
-            # If user filtered for specific position, skip mismatches
-            if pos_raw not in {"", "ALL"} or pos in blocked_positions:
-                continue
-        pass_att = _safe_int(r.get("passing_attempts")) or 0
-        name = (str(p.get("first_name") or "").strip() + " " + str(p.get("last_name") or "").strip()).strip() or str(pid)
-        tid = _safe_int(r.get("team_id"))
+    for pass_yds, pid, pos, r, p in heapq.nlargest(k, ranked, key=itemgetter(0)):
+        name = _full_name(p.get("first_name"), p.get("last_name"), pid)
+        team_abbr = (r.get("nfl_teams") or {}).get("abbreviation") or None
         out.append(
             {
                 "season": season,
                 "week": week,
-                "team": tmap.get(tid) if tid is not None else None,
+                "team": team_abbr,
                 "player_id": str(pid),
                 "player_name": name,
                 "position": pos,
-                "passing_attempts": pass_att,
+                "passing_attempts": _safe_int(r.get("passing_attempts")) or 0,
                 "passing_completions": _safe_int(r.get("passing_completions")) or 0,
-                "passing_yards": _safe_int(r.get("passing_yards")) or 0,
+                "passing_yards": pass_yds,
                 "passing_tds": _safe_int(r.get("passing_touchdowns")) or 0,
                 "interceptions": _safe_int(r.get("passing_interceptions")) or 0,
-                "photoUrl": player_photo_url_from_name_team(name=name, team=tmap.get(tid) if tid is not None else None),
+                "photoUrl": player_photo_url_from_name_team(name=name, team=team_abbr),
             }
         )
-    
-    # FORCE SORT by passing yards descending to fix ordering issues
-    out.sort(key=lambda x: (x.get('passing_yards') or 0), reverse=True)
-    
-    return out[: min(max(limit, 1), 200)]
+    return out
 
 
+@_cached_dashboard
 def passing_season(
     sb: SupabaseClient,
     *,
@@ -1031,6 +1407,7 @@ def passing_season(
     q: Optional[str] = None,
     limit: int,
 ) -> list[dict[str, Any]]:
+    k = _top_k(limit)
     # Keep this endpoint simple and robust: query the season-stats table directly and order by passing yards.
     # This avoids relying on broad player-list queries that may be subject to server-side max row caps.
     pos_raw = (position or "").strip().upper()
@@ -1039,12 +1416,14 @@ def passing_season(
     filters: dict[str, Any] = {
         "season": f"eq.{int(season)}",
         "postseason": "eq.false",
-        "or": "(passing_yards.gt.0,passing_attempts.gt.0,passing_touchdowns.gt.0)",
     }
 
     if team:
-        t = sb.select("nfl_teams", select="id", filters={"abbreviation": f"eq.{team}"}, limit=1)
-        tid = _safe_int(t[0].get("id")) if t else None
+        _prefetch(lambda: _has_column(sb, "nfl_player_season_stats", "has_passing"), lambda: _team_lookup(sb))
+    key, value = _passing_rows_filter(sb, "nfl_player_season_stats")
+    filters[key] = value
+    if team:
+        tid = _team_id_for_abbr(sb, team)
         if tid is not None:
             # PostgREST foreign-table filter syntax (season_stats -> nfl_players).
             filters["nfl_players.team_id"] = f"eq.{tid}"
@@ -1066,15 +1445,16 @@ def passing_season(
         limit=req_limit,
     )
 
-    out: list[dict[str, Any]] = []
+    # First pass only filters and keeps the sort key; dicts are built for the top rows.
+    ranked: list[tuple[int, int, Optional[str], dict[str, Any], dict[str, Any]]] = []
     for r in rows:
         pid = _safe_int(r.get("player_id"))
         if pid is None:
             continue
 
         p = r.get("nfl_players") or {}
-        pos = (p.get("position_abbreviation") or "").strip().upper() or None
-        is_unknown_pos = (not pos) or (pos in {"UNK", "UNKNOWN", "NULL", "ROOKIE"})
+        pos = _norm_pos(p.get("position_abbreviation"))
+        is_unknown_pos = (not pos) or (pos in _UNKNOWN_POSITIONS)
 
         # If the user filtered for a position, enforce it, but allow unknown positions when stats prove the role.
         if pos_filter:
@@ -1088,9 +1468,13 @@ def passing_season(
                 if not (pass_yds > 0 or pass_att > 0 or pass_tds > 0):
                     continue
 
+        ranked.append((_safe_int(r.get("passing_yards")) or 0, pid, pos, r, p))
+
+    out: list[dict[str, Any]] = []
+    for pass_yds, pid, pos, r, p in heapq.nlargest(k, ranked, key=itemgetter(0)):
         team_obj = p.get("nfl_teams") or {}
         team_abbr = team_obj.get("abbreviation") or None
-        name = (str(p.get("first_name") or "").strip() + " " + str(p.get("last_name") or "").strip()).strip() or str(pid)
+        name = _full_name(p.get("first_name"), p.get("last_name"), pid)
 
         out.append(
             {
@@ -1101,17 +1485,16 @@ def passing_season(
                 "position": pos or "UNK",
                 "passing_attempts": _safe_int(r.get("passing_attempts")) or 0,
                 "passing_completions": _safe_int(r.get("passing_completions")) or 0,
-                "passing_yards": _safe_int(r.get("passing_yards")) or 0,
+                "passing_yards": pass_yds,
                 "passing_tds": _safe_int(r.get("passing_touchdowns")) or 0,
                 "interceptions": _safe_int(r.get("passing_interceptions")) or 0,
                 "photoUrl": player_photo_url_from_name_team(name=name, team=team_abbr),
             }
         )
-
-    out.sort(key=lambda x: int(x.get("passing_yards") or 0), reverse=True)
-    return out[: min(max(limit, 1), 200)]
+    return out
 
 
+@_cached_dashboard
 def total_yards_dashboard(
     sb: SupabaseClient,
     *,
@@ -1121,78 +1504,74 @@ def total_yards_dashboard(
     position: Optional[str],
     limit: int,
 ) -> list[dict[str, Any]]:
+    k = _top_k(limit)
     # Total yards = rushing + receiving.
     # Default behavior: show skill players (RB/WR/TE). `HB` is treated as `RB`.
     filters: dict[str, Any] = {"season": f"eq.{int(season)}", "week": f"eq.{int(week)}", "postseason": "eq.false"}
     if team:
-        t = sb.select("nfl_teams", select="id", filters={"abbreviation": f"eq.{team}"}, limit=1)
-        tid = _safe_int(t[0].get("id")) if t else None
+        _prefetch(lambda: _has_column(sb, "nfl_player_game_stats", "total_yards"), lambda: _team_lookup(sb))
+        tid = _team_id_for_abbr(sb, team)
         if tid is not None:
             filters["team_id"] = f"eq.{tid}"
-    stats = sb.select(
-        "nfl_player_game_stats",
-        select="player_id,team_id,season,week,rushing_yards,rushing_touchdowns,receiving_yards,receiving_touchdowns,rushing_attempts,receptions,receiving_targets",
-        filters=filters,
-        limit=5000,
+    pos_raw, allowed_positions, pos_scope = _position_scope(position, _SKILL_POSITIONS)
+    if pos_scope:
+        filters["nfl_players.or"] = pos_scope
+    # Use PostgREST embedding to avoid extra round-trips for player/team hydration.
+    select = (
+        "player_id,rushing_yards,rushing_touchdowns,receiving_yards,receiving_touchdowns,"
+        "rushing_attempts,receptions,receiving_targets,"
+        "nfl_players!inner(first_name,last_name,position_abbreviation),"
+        "nfl_teams(abbreviation)"
     )
-    # DON'T slice yet - need to filter by position first
-
-    pids = sorted({_safe_int(r.get("player_id")) for r in stats if _safe_int(r.get("player_id")) is not None})
-    players = sb.select("nfl_players", select="id,first_name,last_name,position_abbreviation", filters={"id": _in_list(pids)}, limit=len(pids))
-    pmap = {int(p["id"]): p for p in players if _safe_int(p.get("id")) is not None}
-    team_ids = sorted({_safe_int(r.get("team_id")) for r in stats if _safe_int(r.get("team_id")) is not None})
-    tmap = _team_map(sb, [t for t in team_ids if t is not None])
-
-    pos_raw = (position or "").strip().upper()
-    if pos_raw in {"", "ALL"}:
-        allowed_positions = {"RB", "WR", "TE"}
-    elif pos_raw == "HB":
-        allowed_positions = {"RB"}
+    if _has_column(sb, "nfl_player_game_stats", "total_yards"):
+        # Stored total_yards column: rank in Postgres and only fetch pages until k rows pass the gate.
+        scoped: Iterable[tuple[int, Optional[str], dict[str, Any], dict[str, Any]]] = _scoped_top_rows(
+            sb,
+            "nfl_player_game_stats",
+            k=k,
+            pos_raw=pos_raw,
+            allowed_positions=allowed_positions,
+            select=select,
+            filters=filters,
+            order="total_yards.desc,player_id.asc",
+        )
     else:
-        allowed_positions = {pos_raw}
-    
-    # Defensive/special teams positions to exclude (unless user explicitly filters for them)
-    blocked_positions = {"DB", "CB", "S", "SS", "FS", "LB", "ILB", "OLB", "DL", "DE", "DT", "NT", "OL", "OT", "OG", "C", "K", "P", "LS"}
-    
-    out = []
-    for r in stats:
-        pid = _safe_int(r.get("player_id"))
-        if pid is None:
-            continue
-        p = pmap.get(pid, {})
-        pos = (p.get("position_abbreviation") or "").strip().upper() or None
-        
-        # Allow NULL/UNK/empty positions if they have yards (already filtered by query)
-        # But block defensive/special teams positions unless explicitly requested
-        if pos and pos not in allowed_positions:
-            # If user filtered for specific position, skip mismatches
-            if pos_raw not in {"", "ALL"} or pos in blocked_positions:
-                continue
-        name = (str(p.get("first_name") or "").strip() + " " + str(p.get("last_name") or "").strip()).strip() or str(pid)
-        tid = _safe_int(r.get("team_id"))
+        stats = sb.select("nfl_player_game_stats", select=select, filters=filters, limit=_SCOPED_SCAN_LIMIT)
+        scoped = _scoped_game_rows(stats, pos_raw, allowed_positions)
+
+    # First pass only keeps the sort key; dicts are built for the top rows.
+    # The parsed yardages ride along with the sort key so the top rows don't parse them again.
+    ranked: list[tuple[int, int, Optional[str], dict[str, Any], dict[str, Any], int, int]] = []
+    for pid, pos, r, p in scoped:
         rush_y = _safe_int(r.get("rushing_yards")) or 0
         rec_y = _safe_int(r.get("receiving_yards")) or 0
+        ranked.append((rush_y + rec_y, pid, pos, r, p, rush_y, rec_y))
+
+    out = []
+    for total, pid, pos, r, p, rush_y, rec_y in heapq.nlargest(k, ranked, key=itemgetter(0)):
+        name = _full_name(p.get("first_name"), p.get("last_name"), pid)
+        team_abbr = (r.get("nfl_teams") or {}).get("abbreviation") or None
         rush_td = _safe_int(r.get("rushing_touchdowns")) or 0
         rec_td = _safe_int(r.get("receiving_touchdowns")) or 0
         out.append(
             {
                 "season": season,
                 "week": week,
-                "team": tmap.get(tid) if tid is not None else None,
+                "team": team_abbr,
                 "player_id": str(pid),
                 "player_name": name,
                 "position": pos,
                 "rush_yards": rush_y,
                 "rec_yards": rec_y,
-                "total_yards": rush_y + rec_y,
+                "total_yards": total,
                 "total_tds": rush_td + rec_td,
-                "photoUrl": player_photo_url_from_name_team(name=name, team=tmap.get(tid) if tid is not None else None),
+                "photoUrl": player_photo_url_from_name_team(name=name, team=team_abbr),
             }
         )
-    out.sort(key=lambda x: int(x.get("total_yards") or 0), reverse=True)
-    return out[: min(max(limit, 1), 200)]
+    return out
 
 
+@_cached_dashboard
 def total_yards_season(
     sb: SupabaseClient,
     *,
@@ -1202,47 +1581,89 @@ def total_yards_season(
     q: Optional[str] = None,
     limit: int,
 ) -> list[dict[str, Any]]:
+    k = _top_k(limit)
     # Default behavior: show skill players (RB/WR/TE). `HB` is treated as `RB`.
     pos_raw = (position or "").strip().upper()
     if pos_raw in {"", "ALL"}:
-        allowed_positions = {"RB", "WR", "TE"}
+        allowed_positions = _SKILL_POSITIONS
     elif pos_raw == "HB":
-        allowed_positions = {"RB"}
+        allowed_positions = _RB_POSITIONS
     else:
-        allowed_positions = {pos_raw}
+        allowed_positions = frozenset((pos_raw,))
 
-    # Defensive/special teams positions to exclude (unless user explicitly filters for them)
-    blocked_positions = {"DB", "CB", "S", "SS", "FS", "LB", "ILB", "OLB", "DL", "DE", "DT", "NT", "OL", "OT", "OG", "C", "K", "P", "LS"}
 
-    rows = get_players_list(sb, season=season, position=None, team=team, q=q, limit=8000)
-    out: list[dict[str, Any]] = []
-    for r in rows:
-        pos = (str(r.get("position") or "")).strip().upper()
+    view_filters: dict[str, Any] = {}
+    if pos_raw not in {"", "ALL"}:
+        # Explicit filter: exact position only (the view already drops defense/special teams).
+        view_filters["position"] = f"eq.{next(iter(allowed_positions))}"
+    needle = _sanitize_search(q)
+    if needle:
+        view_filters["or"] = f"(first_name.ilike.*{needle}*,last_name.ilike.*{needle}*)"
+    view_rows = _season_view_rows(
+        sb,
+        season=season,
+        team=team,
+        select="rushing_yards,receiving_yards,total_yards,total_tds",
+        order="total_yards.desc",
+        limit=k,
+        filters=view_filters,
+    )
+    if view_rows is not None:
+        view_out: list[dict[str, Any]] = []
+        for r in view_rows:
+            pid, name, team_abbr, pos = _season_view_identity(r)
+            view_out.append(
+                {
+                    "season": season,
+                    "team": team_abbr,
+                    "player_id": pid,
+                    "player_name": name,
+                    "position": pos,
+                    "rush_yards": _safe_int(r.get("rushing_yards")) or 0,
+                    "rec_yards": _safe_int(r.get("receiving_yards")) or 0,
+                    "total_yards": _safe_int(r.get("total_yards")) or 0,
+                    "total_tds": _safe_int(r.get("total_tds")) or 0,
+                    "photoUrl": player_photo_url_from_name_team(name=name, team=team_abbr),
+                }
+            )
+        return view_out
+
+    rows = _player_rows(sb, season=season, position=None, team=team, q=q, limit=8000)
+    kept: list[int] = []
+    totals: list[int] = []
+    for i, r in enumerate(rows):
+        pos = r.position
         # Allow NULL/UNK/empty positions if they have yards
         # Block defensive/special teams positions unless explicitly requested
         if pos and pos not in allowed_positions:
-            if pos_raw not in {"", "ALL"} or pos in blocked_positions:
+            if pos_raw not in {"", "ALL"} or pos in _BLOCKED_POSITIONS:
                 continue
-        rush_y = int(r.get("rushingYards") or 0)
-        rec_y = int(r.get("receivingYards") or 0)
-        rush_td = int(r.get("rushingTouchdowns") or 0)
-        rec_td = int(r.get("receivingTouchdowns") or 0)
+        kept.append(i)
+        totals.append(r.rushingYards + r.receivingYards)
+
+    # Only the top rows are turned into response dicts.
+    out: list[dict[str, Any]] = []
+    for ki in _top_indices(totals, k):
+        r = rows[kept[ki]]
+        rush_y = r.rushingYards
+        rec_y = r.receivingYards
+        rush_td = r.rushingTouchdowns
+        rec_td = r.receivingTouchdowns
         out.append(
             {
                 "season": season,
-                "team": r.get("team"),
-                "player_id": r.get("player_id"),
-                "player_name": r.get("player_name"),
-                "position": r.get("position"),
+                "team": r.team,
+                "player_id": r.player_id,
+                "player_name": r.player_name,
+                "position": r.position,
                 "rush_yards": rush_y,
                 "rec_yards": rec_y,
-                "total_yards": rush_y + rec_y,
+                "total_yards": totals[ki],
                 "total_tds": rush_td + rec_td,
-                "photoUrl": player_photo_url_from_name_team(name=str(r.get("player_name") or ""), team=str(r.get("team") or "")),
+                "photoUrl": player_photo_url_from_name_team(name=r.player_name, team=r.team),
             }
         )
-    out.sort(key=lambda x: int(x.get("total_yards") or 0), reverse=True)
-    return out[: min(max(limit, 1), 200)]
+    return out
 
 
 def advanced_passing_leaderboard(
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
 import argparse
+import gzip
+import hashlib
 import json
 import mimetypes
 import os
+import queue
 import sqlite3
+import threading
+import time
+from contextlib import AbstractContextManager, contextmanager, suppress
+from functools import lru_cache
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from string import Template
-from typing import Any, Optional
-from urllib.parse import parse_qs, urlparse
+from typing import Any, Callable, Iterator, Optional
+from urllib.parse import parse_qsl, urlparse
+
+try:
+    import orjson
+except ImportError:  # optional: faster serialization of the leaderboard payloads
+    orjson = None  # type: ignore[assignment]
 
 from src.web import queries
 from src.web import queries_supabase
@@ -322,7 +334,14 @@ INDEX_HTML = """<!doctype html>
             if (state.team) base.set("team", state.team);
             base.set("limit", "25");
 
-            const recvGame = await getJSON("/api/receiving_dashboard?" + base.toString());
+            // Independent endpoints: fetch them concurrently (the server handles each connection on its own thread).
+            const q = base.toString();
+            const [recvGame, rushGame, recvSeason, rushSeason] = await Promise.all([
+              getJSON("/api/receiving_dashboard?" + q),
+              getJSON("/api/rushing_dashboard?" + q),
+              getJSON("/api/receiving_season?" + q),
+              getJSON("/api/rushing_season?" + q),
+            ]);
             renderWithSort(
               document.getElementById("targets"),
               recvGame.rows,
@@ -341,7 +360,6 @@ INDEX_HTML = """<!doctype html>
               "targets"
             );
 
-            const rushGame = await getJSON("/api/rushing_dashboard?" + base.toString());
             renderWithSort(
               document.getElementById("epa"),
               rushGame.rows,
@@ -358,7 +376,6 @@ INDEX_HTML = """<!doctype html>
               "rush_yards"
             );
 
-            const recvSeason = await getJSON("/api/receiving_season?" + base.toString());
             renderWithSort(
               document.getElementById("aypt"),
               recvSeason.rows,
@@ -376,7 +393,6 @@ INDEX_HTML = """<!doctype html>
               "targets"
             );
 
-            const rushSeason = await getJSON("/api/rushing_season?" + base.toString());
             renderWithSort(
               document.getElementById("tshare"),
               rushSeason.rows,
@@ -404,12 +420,159 @@ INDEX_HTML = """<!doctype html>
 """
 
 
+def _minify_html(html: str) -> str:
+    # Drop indentation and blank lines only. Newlines stay, so ASI and `//` comments in the inline JS
+    # keep working, and every template literal in the page is single-line (no <pre>/<textarea> either).
+    return "\n".join(line.strip() for line in html.splitlines() if line.strip())
+
+
+# The legacy page never changes at runtime: minify, encode and gzip it once instead of on every hit.
+INDEX_HTML_BYTES = _minify_html(INDEX_HTML).encode("utf-8")
+INDEX_HTML_GZ = gzip.compress(INDEX_HTML_BYTES, 9)
+
+
+_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+)
+
+
+def _open_sqlite(db_path: Path) -> sqlite3.Connection:
+    # Pooled connections move between handler threads, but only one request uses a connection at a time.
+    c = sqlite3.connect(str(db_path), check_same_thread=False)
+    c.row_factory = sqlite3.Row
+    # WAL lets the viewer keep reading while an ingest writes. Switching needs write access to the
+    # DB directory, so a read-only copy just stays in its current journal mode.
+    with suppress(sqlite3.OperationalError):
+        c.execute("PRAGMA journal_mode=WAL")
+    for pragma in _SQLITE_PRAGMAS:
+        c.execute(pragma)
+    return c
+
+
+# ThreadingHTTPServer starts a thread per connection, so a thread-local cache would rarely be reused;
+# idle connections go back into a shared queue instead. A burst may open more connections, but only
+# _SQLITE_POOL_MAX_IDLE per file are kept once it's over (each one holds its own mmap and page cache).
+_SQLITE_POOL_MAX_IDLE = 8
+# Each pool is tagged with the file's (st_dev, st_ino): `manage_db_versions.py activate` swaps the path for a
+# symlink to another file, and connections to the old inode must not outlive that.
+_SQLITE_POOL: dict[Path, tuple[Optional[tuple[int, int]], "queue.SimpleQueue[sqlite3.Connection]"]] = {}
+_SQLITE_POOL_LOCK = threading.Lock()
+
+
+def _sqlite_file_id(db_path: Path) -> Optional[tuple[int, int]]:
+    try:
+        st = os.stat(db_path)  # follows the symlink, so a re-pointed link gets a new id
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def _close_idle(idle: "queue.SimpleQueue[sqlite3.Connection]") -> None:
+    while True:
+        try:
+            conn = idle.get_nowait()
+        except queue.Empty:
+            return
+        conn.close()
+
+
+@contextmanager
+def _pooled_sqlite(db_path: Path) -> Iterator[sqlite3.Connection]:
+    file_id = _sqlite_file_id(db_path)
+    with _SQLITE_POOL_LOCK:
+        pool = _SQLITE_POOL.get(db_path)
+        if pool is None or pool[0] != file_id:
+            if pool is not None:
+                _close_idle(pool[1])  # the file was replaced: drop connections to the old one
+            pool = _SQLITE_POOL[db_path] = (file_id, queue.SimpleQueue())
+    idle = pool[1]
+    try:
+        conn = idle.get_nowait()
+    except queue.Empty:
+        conn = _open_sqlite(db_path)
+    try:
+        # Same commit/rollback scope as the old per-request `with sqlite3.connect(...)`, minus the reopen.
+        with conn:
+            yield conn
+    finally:
+        with _SQLITE_POOL_LOCK:
+            keep = _SQLITE_POOL.get(db_path) is pool and idle.qsize() < _SQLITE_POOL_MAX_IDLE
+            if keep:
+                idle.put(conn)
+        if not keep:
+            conn.close()
+
+
+def _json_bytes(obj: Any) -> bytes:
+    if orjson is not None:
+        # Same fallback as json.dumps(default=str) for values orjson can't encode natively.
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=str).encode("utf-8")
+
+
+def _etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+# Load the system MIME tables at import rather than on the first asset request.
+mimetypes.init()
+
+
+@lru_cache(maxsize=256)
+def _content_type(file_name: str) -> str:
+    # Keyed on the file name (not just the suffix) so double extensions resolve exactly as before.
+    content_type, _ = mimetypes.guess_type(file_name)
+    return content_type or "application/octet-stream"
+
+
+# /api/players can return ~12k rows: past this size the list is streamed in batches (see Handler._json_rows).
+_STREAM_MIN_ROWS = 2000
+_STREAM_BATCH_ROWS = 1000
+
+
+# /api/summary and /api/options only change when an ingest runs, but the UI asks for both on every
+# page load. Keep the serialized body for a short while, keyed by endpoint + data source.
+_RESPONSE_CACHE: dict[tuple[str, str], tuple[float, bytes, str]] = {}
+_RESPONSE_CACHE_LOCK = threading.Lock()
+_RESPONSE_TTL_SECONDS = 30.0
+
+
+_PLAYER_SEASON_TOTAL_COLS = (
+    "games_played,receiving_targets,receptions,receiving_yards,receiving_touchdowns,"
+    "rushing_attempts,rushing_yards,rushing_touchdowns,"
+    "passing_attempts,passing_completions,passing_yards,passing_touchdowns,passing_interceptions,qbr,qb_rating"
+)
+
+# Player-detail advanced tables: response key -> (table, columns).
+_ADVANCED_STATS = {
+    "receiving": (
+        "nfl_advanced_receiving_stats",
+        "season,week,targets,receptions,yards,avg_intended_air_yards,avg_yac,avg_expected_yac,avg_yac_above_expectation,avg_cushion,avg_separation,catch_percentage,percent_share_of_intended_air_yards,rec_touchdowns",
+    ),
+    "rushing": (
+        "nfl_advanced_rushing_stats",
+        "season,week,rush_attempts,rush_yards,rush_touchdowns,avg_time_to_los,expected_rush_yards,rush_yards_over_expected,rush_yards_over_expected_per_att,rush_pct_over_expected,efficiency,percent_attempts_gte_eight_defenders,avg_rush_yards",
+    ),
+    "passing": (
+        "nfl_advanced_passing_stats",
+        "season,week,attempts,completions,pass_yards,pass_touchdowns,interceptions,passer_rating,completion_percentage,completion_percentage_above_expectation,expected_completion_percentage,avg_time_to_throw,avg_intended_air_yards,avg_completed_air_yards,avg_air_distance,avg_air_yards_differential,avg_air_yards_to_sticks,max_air_distance,max_completed_air_distance,aggressiveness,games_played",
+    ),
+}
+
+
 def _dict_rows(cur: sqlite3.Cursor) -> list[dict[str, Any]]:
-    cols = [c[0] for c in cur.description] if cur.description else []
-    return [dict(zip(cols, row)) for row in cur.fetchall()]
+    return queries.dict_rows(cur)
 
 
 class Handler(BaseHTTPRequestHandler):
+    # Keep-alive: the dashboard fires several API calls per page load; every response sets Content-Length.
+    protocol_version = "HTTP/1.1"
+    # Idle keep-alive sockets each hold a handler thread; drop them after a minute of silence.
+    timeout = 60
     db_path: Path
     dist_path: Path
     _supabase: Optional[SupabaseClient] = None
@@ -428,45 +591,141 @@ class Handler(BaseHTTPRequestHandler):
             return None
         return Handler._supabase
 
-    def _send(self, code: int, body: bytes, content_type: str) -> None:
+    def _send(
+        self,
+        code: int,
+        body: bytes,
+        content_type: str,
+        *,
+        content_encoding: Optional[str] = None,
+        vary: Optional[str] = None,
+    ) -> None:
         self.send_response(code)
         self.send_header("Content-Type", content_type)
         self.send_header("Content-Length", str(len(body)))
+        if content_encoding:
+            self.send_header("Content-Encoding", content_encoding)
+        if vary:
+            self.send_header("Vary", vary)
         self.end_headers()
         self.wfile.write(body)
 
+    def _accepts_gzip(self) -> bool:
+        # Per-coding q-values: an explicit gzip entry wins over `*`, and q=0 means "not acceptable".
+        gzip_q: Optional[float] = None
+        star_q: Optional[float] = None
+        for part in (self.headers.get("Accept-Encoding") or "").split(","):
+            coding, _, params = part.partition(";")
+            coding = coding.strip().lower()
+            q = 1.0
+            for param in params.split(";"):
+                name, _, value = param.partition("=")
+                if name.strip().lower() == "q":
+                    try:
+                        q = float(value)
+                    except ValueError:
+                        q = 0.0
+            if coding in ("gzip", "x-gzip"):
+                gzip_q = q
+            elif coding == "*":
+                star_q = q
+        q = gzip_q if gzip_q is not None else star_q
+        return q is not None and q > 0
+
     def _json(self, obj: Any, code: int = 200) -> None:
-        body = json.dumps(obj, default=str).encode("utf-8")
-        self._send(code, body, "application/json; charset=utf-8")
+        body = _json_bytes(obj)
+        if code == 200:
+            self._send_json_200(body, _etag(body))
+        else:
+            self._send(code, body, "application/json; charset=utf-8")
+
+    def _send_json_200(self, body: bytes, etag: str) -> None:
+        # no-cache = "store, but revalidate": repeat page loads send If-None-Match and get a bodiless 304.
+        inm = self.headers.get("If-None-Match")
+        if inm and (inm.strip() == "*" or etag in (t.strip().removeprefix("W/") for t in inm.split(","))):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
 
-    def _conn(self) -> sqlite3.Connection:
-        c = sqlite3.connect(str(self.db_path))
-        c.row_factory = sqlite3.Row
-        return c
+    def _json_rows(self, head: dict[str, Any], key: str, rows: list[dict[str, Any]]) -> None:
+        """
+        Send `{**head, key: rows}`. Large lists go out with chunked transfer-encoding, serialized a batch
+        at a time, so the full multi-MB body never has to exist as one bytes object.
+        """
+        if len(rows) < _STREAM_MIN_ROWS or self.request_version != "HTTP/1.1":
+            self._json({**head, key: rows})
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        write = self.wfile.write
+        # Never empty: a zero-length chunk would end the body early.
+        prefix = _json_bytes(head)[:-1] + (b"," if head else b"") + _json_bytes(key) + b":["
+        write(b"%X\r\n%s\r\n" % (len(prefix), prefix))
+        for i in range(0, len(rows), _STREAM_BATCH_ROWS):
+            chunk = _json_bytes(rows[i : i + _STREAM_BATCH_ROWS])[1:-1]
+            if i:
+                chunk = b"," + chunk
+            write(b"%X\r\n%s\r\n" % (len(chunk), chunk))
+        write(b"2\r\n]}\r\n0\r\n\r\n")
+
+    def _cached_json(self, path: str, sb: Optional[SupabaseClient], build: Callable[[], Any]) -> None:
+        key = (path, "supabase" if sb is not None else str(self.db_path))
+        now = time.monotonic()
+        with _RESPONSE_CACHE_LOCK:
+            hit = _RESPONSE_CACHE.get(key)
+        if hit is not None and hit[0] > now:
+            _, body, etag = hit
+        else:
+            body = _json_bytes(build())
+            etag = _etag(body)
+            with _RESPONSE_CACHE_LOCK:
+                _RESPONSE_CACHE[key] = (now + _RESPONSE_TTL_SECONDS, body, etag)
+        self._send_json_200(body, etag)
+
+    def _conn(self) -> AbstractContextManager[sqlite3.Connection]:
+        return _pooled_sqlite(self.db_path)
     
     def _serve_static_file(self, file_path: Path) -> None:
         """Serve a static file from the dist directory."""
         try:
-            with open(file_path, 'rb') as f:
-                content = f.read()
-            
-            # Determine content type
-            content_type, _ = mimetypes.guess_type(str(file_path))
-            if content_type is None:
-                content_type = 'application/octet-stream'
-            
-            self._send(200, content, content_type)
+            f = open(file_path, 'rb')
         except FileNotFoundError:
             self._json({"error": "File not found"}, code=404)
+            return
+        with f:
+            size = os.fstat(f.fileno()).st_size
+
+            content_type = _content_type(file_path.name)
+
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(size))
+            self.end_headers()
+            # Kernel copies page cache -> socket (os.sendfile where available) instead of read() + write().
+            self.connection.sendfile(f, 0, size)
 
     def do_GET(self) -> None:  # noqa: N802
         parsed = urlparse(self.path)
         path = parsed.path
-        qs = parse_qs(parsed.query)
+        # One str per key (first occurrence wins, like parse_qs(...)[name][0]) without a list per parameter.
+        qs: dict[str, str] = {}
+        for k, v in parse_qsl(parsed.query):
+            qs.setdefault(k, v)
         sb = self._supabase_client()
 
         def q_int(name: str) -> Optional[int]:
-            raw = qs.get(name, [None])[0]
+            raw = qs.get(name)
             if raw in (None, "", "null"):
                 return None
             try:
@@ -475,36 +734,42 @@ class Handler(BaseHTTPRequestHandler):
                 return None
 
         def q_str(name: str) -> Optional[str]:
-            raw = qs.get(name, [None])[0]
+            raw = qs.get(name)
             if raw in (None, "", "null"):
                 return None
             return str(raw)
 
         # API endpoints
         if path == "/api/summary":
-            if sb is not None:
-                s = queries_supabase.summary(sb)
-                s["db_path"] = "supabase"
-                self._json(s)
-            else:
+
+            def build_summary() -> dict[str, Any]:
+                if sb is not None:
+                    s = queries_supabase.summary(sb)
+                    s["db_path"] = "supabase"
+                    return s
                 with self._conn() as conn:
                     s = queries.summary(conn)
                 s["db_path"] = str(self.db_path)
-                self._json(s)
+                return s
+
+            self._cached_json(path, sb, build_summary)
             return
 
         if path == "/api/options":
-            if sb is not None:
-                self._json(queries_supabase.options(sb))
-            else:
+
+            def build_options() -> dict[str, Any]:
+                if sb is not None:
+                    return queries_supabase.options(sb)
                 with self._conn() as conn:
-                    self._json(queries.options(conn))
+                    return queries.options(conn)
+
+            self._cached_json(path, sb, build_options)
             return
 
         if path == "/api/players":
             # Default high to avoid hiding valid players when the UI requests "all skill players with stats".
-            limit = int(qs.get("limit", ["12000"])[0])
-            offset = int(qs.get("offset", ["0"])[0] or 0)
+            limit = int(qs.get("limit", "12000"))
+            offset = int(qs.get("offset", "0") or 0)
             q = q_str("q")
             if sb is not None:
                 players = queries_supabase.get_players_list(
@@ -517,7 +782,7 @@ class Handler(BaseHTTPRequestHandler):
                     offset=offset,
                 )
                 # Optional paging helpers (ignored by older clients).
-                self._json({"players": players, "nextOffset": offset + len(players), "hasMore": len(players) >= max(limit, 1)})
+                self._json_rows({"nextOffset": offset + len(players), "hasMore": len(players) >= max(limit, 1)}, "players", players)
             else:
                 with self._conn() as conn:
                     players = queries.get_players_list(
@@ -533,13 +798,13 @@ class Handler(BaseHTTPRequestHandler):
                     # Normalize naming to what the frontend expects
                     if "player_position" in p and "position" not in p:
                         p["position"] = p.get("player_position")
-                self._json({"players": players, "nextOffset": 0 + len(players), "hasMore": False})
+                self._json_rows({"nextOffset": 0 + len(players), "hasMore": False}, "players", players)
             return
 
         if path.startswith("/api/player/"):
             player_id = path.split("/api/player/", 1)[1].strip()
             season = q_int("season")
-            include_postseason = (qs.get("include_postseason", ["0"])[0] or "0").strip() in {"1", "true", "TRUE", "yes", "YES"}
+            include_postseason = (qs.get("include_postseason", "0") or "0").strip() in {"1", "true", "TRUE", "yes", "YES"}
             if not player_id or not season:
                 self._json({"error": "missing player_id or season"}, code=400)
                 return
@@ -551,31 +816,48 @@ class Handler(BaseHTTPRequestHandler):
                     self._json({"error": "invalid player_id"}, code=400)
                     return
 
+                # Team, season totals and the advanced tables all hang off nfl_players, so they are embedded
+                # (aliased, each with its own filters) in one select instead of a round-trip per table.
+                embeds = [
+                    "nfl_teams(abbreviation,primary_color,secondary_color)",
+                    f"season_stats:nfl_player_season_stats({_PLAYER_SEASON_TOTAL_COLS})",
+                ]
+                filters = {
+                    "id": f"eq.{pid_int}",
+                    "season_stats.season": f"eq.{int(season)}",
+                    "season_stats.postseason": "eq.false",
+                    "season_stats.limit": "1",
+                }
+                # GOAT advanced stats (weekly + season totals via week=0). Postseason totals only (week=0) when enabled.
+                for kind, (table, cols) in _ADVANCED_STATS.items():
+                    embeds.append(f"adv_{kind}:{table}({cols})")
+                    filters[f"adv_{kind}.season"] = f"eq.{int(season)}"
+                    filters[f"adv_{kind}.postseason"] = "eq.false"
+                    filters[f"adv_{kind}.order"] = "week.asc"
+                    filters[f"adv_{kind}.limit"] = "300"
+                    if include_postseason:
+                        embeds.append(f"post_{kind}:{table}({cols})")
+                        filters[f"post_{kind}.season"] = f"eq.{int(season)}"
+                        filters[f"post_{kind}.postseason"] = "eq.true"
+                        filters[f"post_{kind}.week"] = "eq.0"
+                        filters[f"post_{kind}.limit"] = "10"
                 rows = sb.select(
                     "nfl_players",
-                    select="id,first_name,last_name,position_abbreviation,team_id,height,weight,jersey_number,college,experience,age",
-                    filters={"id": f"eq.{pid_int}"},
+                    select=(
+                        "id,first_name,last_name,position_abbreviation,team_id,height,weight,jersey_number,college,experience,age,"
+                        + ",".join(embeds)
+                    ),
+                    filters=filters,
                     limit=1,
                 )
                 if not rows:
                     self._json({"error": "player not found"}, code=404)
                     return
                 r = rows[0]
-                team_abbr = None
-                team_primary = None
-                team_secondary = None
-                tid = r.get("team_id")
-                if tid not in (None, ""):
-                    teams = sb.select(
-                        "nfl_teams",
-                        select="abbreviation,primary_color,secondary_color",
-                        filters={"id": f"eq.{int(tid)}"},
-                        limit=1,
-                    )
-                    if teams:
-                        team_abbr = teams[0].get("abbreviation")
-                        team_primary = teams[0].get("primary_color")
-                        team_secondary = teams[0].get("secondary_color")
+                team = r.get("nfl_teams") or {}
+                team_abbr = team.get("abbreviation")
+                team_primary = team.get("primary_color")
+                team_secondary = team.get("secondary_color")
                 name = (str(r.get("first_name") or "").strip() + " " + str(r.get("last_name") or "").strip()).strip() or str(pid_int)
                 player = {
                     "player_id": str(pid_int),
@@ -595,16 +877,7 @@ class Handler(BaseHTTPRequestHandler):
                 }
                 player["photoUrl"] = queries_supabase.player_photo_url_from_name_team(name=name, team=team_abbr)
                 # Season totals from nfl_player_season_stats (if present)
-                st = sb.select(
-                    "nfl_player_season_stats",
-                    select=(
-                        "games_played,receiving_targets,receptions,receiving_yards,receiving_touchdowns,"
-                        "rushing_attempts,rushing_yards,rushing_touchdowns,"
-                        "passing_attempts,passing_completions,passing_yards,passing_touchdowns,passing_interceptions,qbr,qb_rating"
-                    ),
-                    filters={"player_id": f"eq.{pid_int}", "season": f"eq.{int(season)}", "postseason": "eq.false"},
-                    limit=1,
-                )
+                st = r.get("season_stats") or []
                 stats = st[0] if st else {}
                 games = int(stats.get("games_played") or 0)
                 targets = int(stats.get("receiving_targets") or 0)
@@ -643,51 +916,13 @@ class Handler(BaseHTTPRequestHandler):
                 }
                 game_logs = queries_supabase.get_player_game_logs(sb, player_id=str(pid_int), season=season, include_postseason=include_postseason)
 
-                # GOAT advanced stats (weekly + season totals via week=0). Postseason totals only (week=0) when enabled.
-                adv_filters = {"player_id": f"eq.{pid_int}", "season": f"eq.{int(season)}", "postseason": "eq.false"}
-                adv_recv = sb.select(
-                    "nfl_advanced_receiving_stats",
-                    select="season,week,targets,receptions,yards,avg_intended_air_yards,avg_yac,avg_expected_yac,avg_yac_above_expectation,avg_cushion,avg_separation,catch_percentage,percent_share_of_intended_air_yards,rec_touchdowns",
-                    filters=adv_filters,
-                    order="week.asc",
-                    limit=300,
-                )
-                adv_rush = sb.select(
-                    "nfl_advanced_rushing_stats",
-                    select="season,week,rush_attempts,rush_yards,rush_touchdowns,avg_time_to_los,expected_rush_yards,rush_yards_over_expected,rush_yards_over_expected_per_att,rush_pct_over_expected,efficiency,percent_attempts_gte_eight_defenders,avg_rush_yards",
-                    filters=adv_filters,
-                    order="week.asc",
-                    limit=300,
-                )
-                adv_pass = sb.select(
-                    "nfl_advanced_passing_stats",
-                    select="season,week,attempts,completions,pass_yards,pass_touchdowns,interceptions,passer_rating,completion_percentage,completion_percentage_above_expectation,expected_completion_percentage,avg_time_to_throw,avg_intended_air_yards,avg_completed_air_yards,avg_air_distance,avg_air_yards_differential,avg_air_yards_to_sticks,max_air_distance,max_completed_air_distance,aggressiveness,games_played",
-                    filters=adv_filters,
-                    order="week.asc",
-                    limit=300,
-                )
-
+                adv_recv = r.get("adv_receiving") or []
+                adv_rush = r.get("adv_rushing") or []
+                adv_pass = r.get("adv_passing") or []
                 postseason_totals = {"receiving": [], "rushing": [], "passing": []}
                 if include_postseason:
-                    post_filters = {"player_id": f"eq.{pid_int}", "season": f"eq.{int(season)}", "postseason": "eq.true", "week": "eq.0"}
-                    postseason_totals["receiving"] = sb.select(
-                        "nfl_advanced_receiving_stats",
-                        select="season,week,targets,receptions,yards,avg_intended_air_yards,avg_yac,avg_expected_yac,avg_yac_above_expectation,avg_cushion,avg_separation,catch_percentage,percent_share_of_intended_air_yards,rec_touchdowns",
-                        filters=post_filters,
-                        limit=10,
-                    )
-                    postseason_totals["rushing"] = sb.select(
-                        "nfl_advanced_rushing_stats",
-                        select="season,week,rush_attempts,rush_yards,rush_touchdowns,avg_time_to_los,expected_rush_yards,rush_yards_over_expected,rush_yards_over_expected_per_att,rush_pct_over_expected,efficiency,percent_attempts_gte_eight_defenders,avg_rush_yards",
-                        filters=post_filters,
-                        limit=10,
-                    )
-                    postseason_totals["passing"] = sb.select(
-                        "nfl_advanced_passing_stats",
-                        select="season,week,attempts,completions,pass_yards,pass_touchdowns,interceptions,passer_rating,completion_percentage,completion_percentage_above_expectation,expected_completion_percentage,avg_time_to_throw,avg_intended_air_yards,avg_completed_air_yards,avg_air_distance,avg_air_yards_differential,avg_air_yards_to_sticks,max_air_distance,max_completed_air_distance,aggressiveness,games_played",
-                        filters=post_filters,
-                        limit=10,
-                    )
+                    for kind in _ADVANCED_STATS:
+                        postseason_totals[kind] = r.get(f"post_{kind}") or []
 
                 self._json(
                     {
@@ -716,10 +951,7 @@ class Handler(BaseHTTPRequestHandler):
                     player = dict(player_row)
                     
                     # Get season totals
-                    season_stats = queries.get_players_list(
-                        conn, season=season, position=None, team=None, limit=1000
-                    )
-                    player_season = next((p for p in season_stats if p['player_id'] == player_id), None)
+                    player_season = queries.get_player_season(conn, player_id, season)
                     
                     if player_season:
                         # Prefer derived team/position from season aggregates (players table may be sparse)
@@ -750,7 +982,7 @@ class Handler(BaseHTTPRequestHandler):
             return
 
         if path == "/api/receiving_dashboard":
-            limit = int(qs.get("limit", ["25"])[0])
+            limit = int(qs.get("limit", "25"))
             if sb is not None:
                 season = q_int("season")
                 week = q_int("week")
@@ -783,7 +1015,7 @@ class Handler(BaseHTTPRequestHandler):
             return
 
         if path == "/api/rushing_dashboard":
-            limit = int(qs.get("limit", ["25"])[0])
+            limit = int(qs.get("limit", "25"))
             if sb is not None:
                 season = q_int("season")
                 week = q_int("week")
@@ -815,7 +1047,7 @@ class Handler(BaseHTTPRequestHandler):
             return
 
         if path == "/api/passing_dashboard":
-            limit = int(qs.get("limit", ["25"])[0])
+            limit = int(qs.get("limit", "25"))
             if sb is not None:
                 season = q_int("season")
                 week = q_int("week")
@@ -836,7 +1068,7 @@ class Handler(BaseHTTPRequestHandler):
             return
 
         if path == "/api/receiving_season":
-            limit = int(qs.get("limit", ["25"])[0])
+            limit = int(qs.get("limit", "25"))
             if sb is not None:
                 season = q_int("season")
                 if season is None:
@@ -859,7 +1091,7 @@ class Handler(BaseHTTPRequestHandler):
             return
 
         if path == "/api/rushing_season":
-            limit = int(qs.get("limit", ["25"])[0])
+            limit = int(qs.get("limit", "25"))
             if sb is not None:
                 season = q_int("season")
                 if season is None:
@@ -889,7 +1121,7 @@ class Handler(BaseHTTPRequestHandler):
             return
 
         if path == "/api/passing_season":
-            limit = int(qs.get("limit", ["25"])[0])
+            limit = int(qs.get("limit", "25"))
             if sb is not None:
                 season = q_int("season")
                 if season is None:
@@ -909,7 +1141,7 @@ class Handler(BaseHTTPRequestHandler):
             return
 
         if path == "/api/total_yards_dashboard":
-            limit = int(qs.get("limit", ["25"])[0])
+            limit = int(qs.get("limit", "25"))
             if sb is not None:
                 season = q_int("season")
                 week = q_int("week")
@@ -930,7 +1162,7 @@ class Handler(BaseHTTPRequestHandler):
             return
 
         if path == "/api/total_yards_season":
-            limit = int(qs.get("limit", ["25"])[0])
+            limit = int(qs.get("limit", "25"))
             if sb is not None:
                 season = q_int("season")
                 if season is None:
@@ -960,8 +1192,8 @@ class Handler(BaseHTTPRequestHandler):
                 self._json({"error": "missing season"}, code=400)
                 return
             
-            sort_by = qs.get("sort", ["avg_air_distance"])[0]
-            limit = int(qs.get("limit", ["200"])[0])
+            sort_by = qs.get("sort", "avg_air_distance")
+            limit = int(qs.get("limit", "200"))
             position = q_str("position")
             team = q_str("team")
             
@@ -981,8 +1213,8 @@ class Handler(BaseHTTPRequestHandler):
                 self._json({"error": "missing season"}, code=400)
                 return
             
-            sort_by = qs.get("sort", ["rush_yards_over_expected"])[0]
-            limit = int(qs.get("limit", ["200"])[0])
+            sort_by = qs.get("sort", "rush_yards_over_expected")
+            limit = int(qs.get("limit", "200"))
             position = q_str("position")
             team = q_str("team")
             
@@ -1002,8 +1234,8 @@ class Handler(BaseHTTPRequestHandler):
                 self._json({"error": "missing season"}, code=400)
                 return
             
-            sort_by = qs.get("sort", ["avg_yac_above_expectation"])[0]
-            limit = int(qs.get("limit", ["200"])[0])
+            sort_by = qs.get("sort", "avg_yac_above_expectation")
+            limit = int(qs.get("limit", "200"))
             position = q_str("position")
             team = q_str("team")
             
@@ -1027,8 +1259,8 @@ class Handler(BaseHTTPRequestHandler):
             if not team_abbr:
                 self._json({"error": "missing team"}, code=400)
                 return
-            season = qs.get("season", [None])[0]
-            week = qs.get("week", [None])[0]
+            season = qs.get("season")
+            week = qs.get("week")
             self._send(
                 200,
                 self._render_team_page(team_abbr, season=season, week=week).encode("utf-8"),
@@ -1059,7 +1291,13 @@ class Handler(BaseHTTPRequestHandler):
 
         # Fallback to old UI if dist doesn't exist
         if path == "/" or path == "/index.html":
-            self._send(200, INDEX_HTML.encode("utf-8"), "text/html; charset=utf-8")
+            # Both variants carry Vary, so shared caches key the page on Accept-Encoding.
+            if self._accepts_gzip():
+                self._send(
+                    200, INDEX_HTML_GZ, "text/html; charset=utf-8", content_encoding="gzip", vary="Accept-Encoding"
+                )
+            else:
+                self._send(200, INDEX_HTML_BYTES, "text/html; charset=utf-8", vary="Accept-Encoding")
             return
 
         self._json({"error": "not found", "path": path}, code=404)
@@ -1336,10 +1574,16 @@ class Handler(BaseHTTPRequestHandler):
         )
 
 
+def _make_server(host: str, port: int) -> ThreadingHTTPServer:
+    # One daemon thread per connection: an idle keep-alive socket only ties up its own thread,
+    # so open browser tabs can never starve new clients the way a fixed worker pool would.
+    return ThreadingHTTPServer((host, port), Handler)
+
+
 def run(db_path: str, host: str, port: int) -> None:
     Handler.db_path = Path(db_path).resolve()
     Handler.dist_path = Path(__file__).parent.parent.parent / "dist"
-    server = ThreadingHTTPServer((host, port), Handler)
+    server = _make_server(host, port)
     
     ui_type = "React UI" if Handler.dist_path.exists() else "Legacy UI"
     print(f"Serving {ui_type} at http://{host}:{port}/ (db={Handler.db_path})")
@@ -0,0 +1,42 @@
+-- Optional: denormalised "has passing stats" flag for the passing leaderboards.
+-- Replaces the `or=(passing_yards.gt.0,passing_attempts.gt.0,passing_touchdowns.gt.0)` filter
+-- (a bitmap-OR over three nullable columns) with a single boolean that partial indexes can use.
+--
+-- Apply this in Supabase SQL Editor after schema_stats.sql.
+-- Adding a stored generated column rewrites the table once; run it outside peak hours.
+-- The API probes for the column once per process and keeps using the `or=(...)` filter until it exists.
+
+begin;
+
+alter table public.nfl_player_game_stats
+  add column if not exists has_passing boolean generated always as (
+    coalesce(passing_yards, 0) > 0
+    or coalesce(passing_attempts, 0) > 0
+    or coalesce(passing_touchdowns, 0) > 0
+  ) stored;
+
+alter table public.nfl_player_season_stats
+  add column if not exists has_passing boolean generated always as (
+    coalesce(passing_yards, 0) > 0
+    or coalesce(passing_attempts, 0) > 0
+    or coalesce(passing_touchdowns, 0) > 0
+  ) stored;
+
+-- Weekly passing leaderboard: filter + `order=passing_yards.desc.nullslast` straight off the index.
+create index if not exists idx_pgs_has_passing_season_week
+  on public.nfl_player_game_stats (season, week)
+  where has_passing;
+
+create index if not exists idx_pgs_has_passing_season_week_pass_yds
+  on public.nfl_player_game_stats (season, week, postseason, passing_yards desc nulls last)
+  where has_passing;
+
+-- Season passing leaderboard.
+create index if not exists idx_pss_has_passing_season_post_pass_yds
+  on public.nfl_player_season_stats (season, postseason, passing_yards desc nulls last)
+  where has_passing;
+
+commit;
+
+-- Let PostgREST see the new columns.
+notify pgrst, 'reload schema';
@@ -0,0 +1,24 @@
+-- Optional: stored total (rushing + receiving) yards for the weekly total-yards leaderboard.
+-- Lets PostgREST `order=total_yards.desc` + `limit` return just the top N rows instead of the whole week.
+--
+-- Apply this in Supabase SQL Editor after schema_stats.sql.
+-- Adding a stored generated column rewrites the table once; run it outside peak hours.
+-- The API probes for the column once per process and keeps ranking in Python until it exists.
+
+begin;
+
+alter table public.nfl_player_game_stats
+  add column if not exists total_yards integer generated always as (
+    coalesce(rushing_yards, 0) + coalesce(receiving_yards, 0)
+  ) stored;
+
+create index if not exists idx_pgs_season_week_post_total_yds
+  on public.nfl_player_game_stats (season, week, postseason, total_yards desc);
+
+create index if not exists idx_pgs_season_week_post_team_total_yds
+  on public.nfl_player_game_stats (season, week, postseason, team_id, total_yards desc);
+
+commit;
+
+-- Let PostgREST see the new column.
+notify pgrst, 'reload schema';
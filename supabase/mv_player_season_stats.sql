@@ -0,0 +1,81 @@
+-- Optional materialized view for the season leaderboards (receiving/rushing/total yards).
+-- Pre-joins season stats + player + team and pre-computes team shares, so the API can
+-- fetch the top N rows directly instead of downloading every season row and aggregating in Python.
+--
+-- Apply this in Supabase SQL Editor after schema_core.sql + schema_stats.sql.
+-- The API probes for the view once per process and falls back to the Python path when it is missing.
+
+begin;
+
+create materialized view if not exists public.mv_player_season_stats as
+with base as (
+  select
+    s.player_id,
+    s.season,
+    s.postseason,
+    s.games_played,
+    s.passing_attempts,
+    s.passing_completions,
+    s.passing_yards,
+    s.passing_touchdowns,
+    s.passing_interceptions,
+    s.rushing_attempts,
+    s.rushing_yards,
+    s.rushing_touchdowns,
+    s.receptions,
+    s.receiving_yards,
+    s.receiving_touchdowns,
+    s.receiving_targets,
+    p.first_name,
+    p.last_name,
+    -- Same normalisation as the API: trimmed, upper-cased, UNK when missing.
+    coalesce(nullif(upper(trim(p.position_abbreviation)), ''), 'UNK') as position,
+    p.team_id,
+    t.abbreviation as team
+  from public.nfl_player_season_stats s
+  join public.nfl_players p on p.id = s.player_id
+  left join public.nfl_teams t on t.id = p.team_id
+  -- Defensive/special teams positions never show up on the offensive leaderboards.
+  where coalesce(upper(trim(p.position_abbreviation)), '') not in (
+    'DB', 'CB', 'S', 'SS', 'FS', 'LB', 'ILB', 'OLB', 'DL', 'DE', 'DT', 'NT', 'OL', 'OT', 'OG', 'C', 'K', 'P', 'LS'
+  )
+)
+select
+  b.*,
+  coalesce(b.rushing_yards, 0) + coalesce(b.receiving_yards, 0) as total_yards,
+  coalesce(b.rushing_touchdowns, 0) + coalesce(b.receiving_touchdowns, 0) as total_tds,
+  coalesce(b.rushing_attempts, 0)::double precision
+    / nullif(sum(coalesce(b.rushing_attempts, 0)) over w, 0) as team_rush_share,
+  coalesce(b.receiving_targets, 0)::double precision
+    / nullif(sum(coalesce(b.receiving_targets, 0)) over w, 0) as team_target_share
+from base b
+window w as (partition by b.season, b.postseason, b.team_id);
+
+-- Required for `refresh materialized view concurrently`.
+create unique index if not exists uq_mv_pss_player_season_post
+  on public.mv_player_season_stats (player_id, season, postseason);
+
+create index if not exists idx_mv_pss_season_post_total_yds
+  on public.mv_player_season_stats (season, postseason, total_yards desc);
+
+create index if not exists idx_mv_pss_season_post_rush_yds
+  on public.mv_player_season_stats (season, postseason, rushing_yards desc);
+
+create index if not exists idx_mv_pss_season_post_recv_tgt
+  on public.mv_player_season_stats (season, postseason, receiving_targets desc);
+
+create index if not exists idx_mv_pss_team
+  on public.mv_player_season_stats (team_id);
+
+commit;
+
+-- Let PostgREST see the new relation.
+notify pgrst, 'reload schema';
+
+-- Refresh after each season-stats ingest (or nightly). With pg_cron enabled:
+--
+--   select cron.schedule(
+--     'refresh_mv_player_season_stats',
+--     '15 8 * * *',
+--     $$refresh materialized view concurrently public.mv_player_season_stats$$
+--   );
@@ -171,3 +171,53 @@ def test_game_logs_exclude_postseason_by_default(conn):
     assert rows2[-1]["is_postseason"] == 1
 
 
+def test_player_season_matches_the_full_players_list(conn):
+    cur = conn.cursor()
+    cur.executemany("INSERT OR IGNORE INTO teams(team_abbr) VALUES (?)", [("KC",), ("BUF",)])
+    cur.executemany(
+        "INSERT INTO games(game_id, season, week, home_team, away_team) VALUES (?, ?, ?, ?, ?)",
+        [("G1", 2024, 1, "KC", "BUF"), ("G2", 2024, 2, "BUF", "KC"), ("G0", 2023, 1, "KC", "BUF")],
+    )
+    cur.executemany(
+        "INSERT INTO players(player_id, player_name, position, team_abbr) VALUES (?, ?, ?, ?)",
+        [("REC", "Only Catches", "WR", "KC"), ("RUSH", "Only Runs", "RB", "BUF"), ("MOVE", "Got Traded", "RB", "BUF")],
+    )
+    # (game, play, season, week, posteam, defteam, rush, complete_pass, yards, receiver, rusher)
+    cur.executemany(
+        """
+        INSERT INTO plays(
+            game_id, play_id, season, week, posteam, defteam,
+            rush, complete_pass, yards_gained, receiver_id, rusher_id
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            ("G1", 1, 2024, 1, "KC", "BUF", 0, 1, 12, "REC", None),
+            ("G1", 2, 2024, 1, "KC", "BUF", 0, 0, 0, "REC", None),
+            ("G1", 3, 2024, 1, "BUF", "KC", 1, 0, 4, None, "RUSH"),
+            ("G2", 1, 2024, 2, "BUF", "KC", 1, 0, 7, None, "RUSH"),
+            # MOVE catches two balls for KC in week 1, then runs for BUF in week 2.
+            ("G1", 4, 2024, 1, "KC", "BUF", 0, 1, 9, "MOVE", None),
+            ("G1", 5, 2024, 1, "KC", "BUF", 0, 1, 11, "MOVE", None),
+            ("G2", 2, 2024, 2, "BUF", "KC", 1, 0, 30, None, "MOVE"),
+            ("G0", 1, 2023, 1, "KC", "BUF", 1, 0, 99, None, "MOVE"),
+        ],
+    )
+    conn.commit()
+
+    full = queries.get_players_list(conn, season=2024, position=None, team=None, limit=100)
+    for pid in ("REC", "RUSH", "MOVE"):
+        expected = next(r for r in full if r["player_id"] == pid)
+        assert queries.get_player_season(conn, pid, 2024) == expected
+
+    rec = queries.get_player_season(conn, "REC", 2024)
+    assert (rec["targets"], rec["receptions"], rec["receivingYards"], rec["rushAttempts"]) == (2, 1, 12, 0)
+    rush = queries.get_player_season(conn, "RUSH", 2024)
+    assert (rush["rushAttempts"], rush["rushingYards"], rush["games"], rush["targets"]) == (2, 11, 2, 0)
+
+    # One row per team for the traded player; the team filter picks the right one.
+    moved = queries.get_players_list(conn, season=2024, position=None, team=None, limit=100, player_id="MOVE")
+    assert sorted((r["team"], r["receivingYards"], r["rushingYards"]) for r in moved) == [("BUF", 0, 30), ("KC", 20, 0)]
+    buf = queries.get_players_list(conn, season=2024, position=None, team="BUF", limit=100, player_id="MOVE")
+    assert [(r["team"], r["rushingYards"]) for r in buf] == [("BUF", 30)]
+    assert queries.get_player_season(conn, "MOVE", 2023)["rushingYards"] == 99
+    assert queries.get_player_season(conn, "MOVE", 2022) is None
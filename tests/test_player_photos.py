@@ -53,3 +53,46 @@ def test_player_photo_url_handles_nicknames_and_short_names() -> None:
     assert player_photo_url_from_name_team(name="Josh Palmer", team="LAC") is not None
 
 
+def test_player_photo_url_is_memoized_per_name_team() -> None:
+    player_photo_url_from_name_team(name="Kyle Pitts", team="ATL")
+    before = player_photo_url_from_name_team.cache_info().hits
+    assert player_photo_url_from_name_team(name="Kyle Pitts", team="ATL") is not None
+    assert player_photo_url_from_name_team.cache_info().hits == before + 1
+
+
+def test_gsis_photo_url_is_memoized_per_player_id() -> None:
+    from src.web import queries
+
+    queries.player_photo_url("00-0040676")
+    before = queries._photo_url_for_gsis.cache_info().hits
+    assert queries.player_photo_url("00-0040676") is not None
+    assert queries._photo_url_for_gsis.cache_info().hits == before + 1
+
+
+def test_player_photo_url_skips_name_normalization_without_the_csv(monkeypatch) -> None:
+    from src.web import queries_supabase
+
+    monkeypatch.setattr(queries_supabase, "_photo_maps", lambda: None)
+    before = queries_supabase._merge_name_candidates.cache_info()
+    assert player_photo_url_from_name_team.__wrapped__(name="Someone Uncached", team="ATL") is None
+    assert queries_supabase._merge_name_candidates.cache_info() == before
+
+
+def test_photo_map_is_built_in_memory_without_writing_next_to_the_csv(monkeypatch, tmp_path) -> None:
+    from src.web import queries_supabase
+
+    csv_path = tmp_path / "db_playerids.csv"
+    csv_path.write_text(
+        "merge_name,team,db_season,espn_id,sleeper_id\n"
+        "kyle pitts,ATL,2024,4360248,7553\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(queries_supabase, "_PLAYER_IDS_CSV", csv_path)
+    queries_supabase._photo_maps.cache_clear()
+    try:
+        photo_map = queries_supabase._photo_maps()
+        assert photo_map[(queries_supabase._BY_NAME_TEAM, "kyle pitts", "ATL")].endswith("/4360248.png")
+        assert queries_supabase._photo_maps() is photo_map
+        assert [p.name for p in tmp_path.iterdir()] == ["db_playerids.csv"]
+    finally:
+        queries_supabase._photo_maps.cache_clear()
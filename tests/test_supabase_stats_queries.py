@@ -26,11 +26,12 @@ def test_players_list_filters_to_players_with_stats():
                 "nfl_player_season_stats",
                 "player_id,games_played,passing_attempts,passing_completions,passing_yards,passing_touchdowns,passing_interceptions,qbr,qb_rating,rushing_attempts,rushing_yards,rushing_touchdowns,receptions,receiving_yards,receiving_touchdowns,receiving_targets,nfl_players!inner(id,first_name,last_name,position_abbreviation,team_id,nfl_teams(abbreviation))",
                 (
+                    ("nfl_players.or", "(position_abbreviation.is.null,position_abbreviation.eq.,position_abbreviation.not.in.(C,CB,DB,DE,DL,DT,FS,ILB,K,LB,LS,NT,OG,OL,OLB,OT,P,S,SS))"),
                     ("postseason", "eq.false"),
                     ("season", "eq.2024"),
                 ),
-                "passing_yards.desc.nullslast",
-                5000,
+                "passing_yards.desc.nullslast,player_id.asc",
+                1000,
                 0,
             ): [
                 # has season stats -> included
@@ -73,13 +74,33 @@ def test_players_list_filters_to_players_with_stats():
 def test_player_game_logs_shape():
     sb = SBStub(
         {
-            ("nfl_player_game_stats", "*", (("player_id", "eq.2"), ("postseason", "eq.false"), ("season", "eq.2024")), "week.asc", None, 0): [
-                {"player_id": 2, "game_id": 7001, "season": 2024, "week": 1, "postseason": False, "team_id": 10, "receiving_targets": 8, "receptions": 6, "receiving_yards": 75, "receiving_touchdowns": 1, "rushing_attempts": 0, "rushing_yards": 0, "rushing_touchdowns": 0},
+            # Games are embedded in the stats rows; team abbreviations come from the cached teams table.
+            ("nfl_teams", "id,abbreviation", (), None, 64, 0): [
+                {"id": 10, "abbreviation": "ATL"},
+                {"id": 11, "abbreviation": "NYJ"},
             ],
-            ("nfl_games", "*", (("id", "in.(7001)"),), None, None, 0): [
-                {"id": 7001, "home_team_id": 10, "visitor_team_id": 11, "postseason": False},
+            ("nfl_player_game_stats", "*", (("player_id", "eq.2"), ("postseason", "eq.false"), ("season", "eq.2024")), "week.asc", None, 0): [
+                {
+                    "player_id": 2,
+                    "game_id": 7001,
+                    "season": 2024,
+                    "week": 1,
+                    "postseason": False,
+                    "team_id": 10,
+                    "receiving_targets": 8,
+                    "receptions": 6,
+                    "receiving_yards": 75,
+                    "receiving_touchdowns": 1,
+                    "rushing_attempts": 0,
+                    "rushing_yards": 0,
+                    "rushing_touchdowns": 0,
+                    "nfl_games": {
+                        "home_team_id": 10,
+                        "visitor_team_id": 11,
+                        "postseason": False,
+                    },
+                },
             ],
-            ("nfl_teams", "*", (("id", "in.(10,11)"),), None, None, 0): [{"id": 10, "abbreviation": "ATL"}, {"id": 11, "abbreviation": "NYJ"}],
         }
     )
     logs = queries_supabase.get_player_game_logs(sb, player_id="2", season=2024, include_postseason=False)
@@ -91,6 +112,9 @@ def test_player_game_logs_shape():
     assert g["rec_tds"] == 1
     assert g["home_team"] == "ATL"
     assert g["away_team"] == "NYJ"
+    assert g["team"] == "ATL"
+    assert g["opponent"] == "NYJ"
+    assert g["location"] == "home"
 
 
 def test_players_list_can_filter_by_name_on_embedded_players_relation():
@@ -100,11 +124,12 @@ def test_players_list_can_filter_by_name_on_embedded_players_relation():
                 "nfl_player_season_stats",
                 "player_id,games_played,passing_attempts,passing_completions,passing_yards,passing_touchdowns,passing_interceptions,qbr,qb_rating,rushing_attempts,rushing_yards,rushing_touchdowns,receptions,receiving_yards,receiving_touchdowns,receiving_targets,nfl_players!inner(or(first_name.ilike.*jo*,last_name.ilike.*jo*)id,first_name,last_name,position_abbreviation,team_id,nfl_teams(abbreviation))",
                 (
+                    ("nfl_players.or", "(position_abbreviation.is.null,position_abbreviation.eq.,position_abbreviation.not.in.(C,CB,DB,DE,DL,DT,FS,ILB,K,LB,LS,NT,OG,OL,OLB,OT,P,S,SS))"),
                     ("postseason", "eq.false"),
                     ("season", "eq.2024"),
                 ),
-                "passing_yards.desc.nullslast",
-                1400,
+                "passing_yards.desc.nullslast,player_id.asc",
+                1000,
                 0,
             ): [
                 {
@@ -148,8 +173,8 @@ def test_passing_season_supports_q_name_filter():
                 "nfl_player_season_stats",
                 "player_id,passing_attempts,passing_completions,passing_yards,passing_touchdowns,passing_interceptions,nfl_players(first_name,last_name,position_abbreviation,team_id,nfl_teams(abbreviation))",
                 (
+                    ("has_passing", "eq.true"),
                     ("nfl_players.or", "(first_name.ilike.*jo*,last_name.ilike.*jo*)"),
-                    ("or", "(passing_yards.gt.0,passing_attempts.gt.0,passing_touchdowns.gt.0)"),
                     ("postseason", "eq.false"),
                     ("season", "eq.2024"),
                 ),
@@ -188,11 +213,12 @@ def test_get_players_list_qb_filter_includes_unknown_pos_when_stats_show_qb():
                 "nfl_player_season_stats",
                 "player_id,games_played,passing_attempts,passing_completions,passing_yards,passing_touchdowns,passing_interceptions,qbr,qb_rating,rushing_attempts,rushing_yards,rushing_touchdowns,receptions,receiving_yards,receiving_touchdowns,receiving_targets,nfl_players!inner(id,first_name,last_name,position_abbreviation,team_id,nfl_teams(abbreviation))",
                 (
+                    ("nfl_players.or", "(position_abbreviation.is.null,position_abbreviation.eq.,position_abbreviation.not.in.(C,CB,DB,DE,DL,DT,FS,ILB,K,LB,LS,NT,OG,OL,OLB,OT,P,S,SS))"),
                     ("postseason", "eq.false"),
                     ("season", "eq.2024"),
                 ),
-                "passing_yards.desc.nullslast",
-                5000,
+                "passing_yards.desc.nullslast,player_id.asc",
+                1000,
                 0,
             ): [
                 {
@@ -231,3 +257,273 @@ def test_get_players_list_qb_filter_includes_unknown_pos_when_stats_show_qb():
     assert rows[0]["passingYards"] == 2276
 
 
+def test_team_filter_resolves_abbreviation_once_per_client():
+    class CountingStub(SBStub):
+        def __init__(self, data):
+            super().__init__(data)
+            self.calls: list[str] = []
+
+        def select(self, table, **kw):
+            self.calls.append(table)
+            return super().select(table, **kw)
+
+    sb = CountingStub(
+        {
+            ("nfl_teams", "id,abbreviation", (), None, 64, 0): [
+                {"id": 10, "abbreviation": "ATL"},
+                {"id": 11, "abbreviation": "NYJ"},
+            ],
+        }
+    )
+    # Distinct weeks so every call misses the dashboard cache and resolves the team again.
+    for week in (1, 2, 3):
+        queries_supabase.rushing_dashboard(sb, season=2024, week=week, team="nyj", position=None, limit=25)
+    assert sb.calls.count("nfl_teams") == 1
+    assert queries_supabase._team_id_for_abbr(sb, "ATL") == 10
+    assert queries_supabase._team_id_for_abbr(sb, "XXX") is None
+
+
+def test_team_lookup_is_refetched_after_its_ttl(monkeypatch):
+    class CountingStub(SBStub):
+        calls = 0
+
+        def select(self, table, **kw):
+            CountingStub.calls += 1
+            return [{"id": 10, "abbreviation": "ATL"}]
+
+    sb = CountingStub({})
+    assert queries_supabase._team_id_for_abbr(sb, "atl") == 10
+    assert queries_supabase._team_id_for_abbr(sb, "atl") == 10
+    assert CountingStub.calls == 1
+
+    monkeypatch.setattr(queries_supabase, "_TEAM_LOOKUP_TTL_SECONDS", 0.0)
+    queries_supabase.clear_dashboard_cache()
+    queries_supabase._team_id_for_abbr(sb, "atl")
+    queries_supabase._team_id_for_abbr(sb, "atl")
+    assert CountingStub.calls == 3
+
+
+def test_options_dedupes_and_sorts_seasons_and_weeks():
+    sb = SBStub(
+        {
+            ("nfl_games", "season,week", (), "season.desc,week.asc", 5000, 0): [
+                {"season": 2023, "week": 2},
+                {"season": 2024, "week": 1},
+                {"season": 2024, "week": 2},
+                {"season": None, "week": "3"},
+            ],
+        }
+    )
+    opts = queries_supabase.options(sb)
+    assert opts["seasons"] == [2024, 2023]
+    assert opts["weeks"] == [1, 2, 3]
+
+
+def test_rushing_season_reads_top_rows_from_season_view():
+    sb = SBStub(
+        {
+            (
+                "mv_player_season_stats",
+                "player_id,first_name,last_name,position,team,games_played,rushing_attempts,rushing_yards,rushing_touchdowns,receptions,receiving_yards,team_rush_share",
+                (("postseason", "eq.false"), ("season", "eq.2024")),
+                "rushing_yards.desc.nullslast,player_id.asc",
+                25,
+                0,
+            ): [
+                {
+                    "player_id": 7,
+                    "first_name": "Saquon",
+                    "last_name": "Barkley",
+                    "position": "RB",
+                    "team": "PHI",
+                    "games_played": 16,
+                    "rushing_attempts": 345,
+                    "rushing_yards": 2005,
+                    "rushing_touchdowns": 13,
+                    "receptions": 33,
+                    "receiving_yards": 278,
+                    "team_rush_share": 0.6,
+                },
+            ],
+        }
+    )
+    rows = queries_supabase.rushing_season(sb, season=2024, team=None, position=None, limit=25)
+    assert len(rows) == 1
+    assert rows[0]["player_id"] == "7"
+    assert rows[0]["player_name"] == "Saquon Barkley"
+    assert rows[0]["rush_yards"] == 2005
+    assert rows[0]["team_rush_share"] == 0.6
+    assert rows[0]["ypg"] == pytest.approx(2005 / 16)
+
+
+def test_season_leaderboards_fall_back_when_view_is_missing():
+    from src.database.supabase_client import SupabaseError
+
+    class NoViewStub(SBStub):
+        def select(self, table, **kw):
+            if table == "mv_player_season_stats":
+                raise SupabaseError("relation does not exist", status_code=404)
+            return super().select(table, **kw)
+
+    sb = NoViewStub(
+        {
+            (
+                "nfl_player_season_stats",
+                "*",
+                (
+                    ("nfl_players.or", "(position_abbreviation.is.null,position_abbreviation.eq.,position_abbreviation.not.in.(C,CB,DB,DE,DL,DT,FS,ILB,K,LB,LS,NT,OG,OL,OLB,OT,P,S,SS))"),
+                    ("postseason", "eq.false"),
+                    ("season", "eq.2024"),
+                ),
+                None,
+                None,
+                0,
+            ): [
+                {
+                    "player_id": 2,
+                    "games_played": 10,
+                    "rushing_attempts": 100,
+                    "rushing_yards": 500,
+                    "receptions": 5,
+                    "receiving_yards": 40,
+                    "nfl_players": {"id": 2, "first_name": "A", "last_name": "B", "position_abbreviation": "RB", "nfl_teams": {"abbreviation": "ATL"}},
+                },
+            ],
+        }
+    )
+    rows = queries_supabase.total_yards_season(sb, season=2024, team=None, position=None, limit=10)
+    assert [(r["player_id"], r["total_yards"]) for r in rows] == [("2", 540)]
+
+
+def test_dashboard_results_are_cached_per_client_until_cleared():
+    class CountingStub(SBStub):
+        def __init__(self, data):
+            super().__init__(data)
+            self.calls = 0
+
+        def select(self, table, **kw):
+            if table == "nfl_player_game_stats" and kw.get("select") != "has_passing":
+                self.calls += 1
+            return super().select(table, **kw)
+
+    sb = CountingStub({})
+    for _ in range(3):
+        queries_supabase.passing_dashboard(sb, season=2024, week=1, team=None, position=None, limit=25)
+    assert sb.calls == 1
+
+    # A different client never sees another client's rows.
+    other = CountingStub({})
+    queries_supabase.passing_dashboard(other, season=2024, week=1, team=None, position=None, limit=25)
+    assert other.calls == 1
+
+    queries_supabase.clear_dashboard_cache()
+    queries_supabase.passing_dashboard(sb, season=2024, week=1, team=None, position=None, limit=25)
+    assert sb.calls == 2
+
+
+def test_passing_dashboard_hydrates_players_from_embedded_select():
+    class OneTableStub(SBStub):
+        def select(self, table, **kw):
+            assert table in ("nfl_player_game_stats", "nfl_player_season_stats"), table
+            return super().select(table, **kw)
+
+    sb = OneTableStub(
+        {
+            (
+                "nfl_player_game_stats",
+                "player_id,passing_attempts,passing_completions,passing_yards,passing_touchdowns,passing_interceptions,nfl_players!inner(first_name,last_name,position_abbreviation),nfl_teams(abbreviation)",
+                (
+                    ("has_passing", "eq.true"),
+                    ("nfl_players.or", "(position_abbreviation.is.null,position_abbreviation.eq.,position_abbreviation.not.in.(C,CB,DB,DE,DL,DT,FS,ILB,K,LB,LS,NT,OG,OL,OLB,OT,P,S,SS))"),
+                    ("postseason", "eq.false"),
+                    ("season", "eq.2024"),
+                    ("week", "eq.3"),
+                ),
+                "passing_yards.desc.nullslast",
+                25,
+                0,
+            ): [
+                {"player_id": 5, "team_id": 1, "passing_yards": 120, "passing_attempts": 20, "nfl_players": {"first_name": "Back", "last_name": "Up", "position_abbreviation": "QB"}, "nfl_teams": {"abbreviation": "KC"}},
+                {"player_id": 4, "team_id": 1, "passing_yards": 310, "passing_attempts": 35, "nfl_players": {"first_name": "Patrick", "last_name": "Mahomes", "position_abbreviation": "QB"}, "nfl_teams": {"abbreviation": "KC"}},
+                {"player_id": 9, "team_id": 2, "passing_yards": 30, "passing_attempts": 1, "nfl_players": {"first_name": "Trick", "last_name": "Play", "position_abbreviation": "WR"}, "nfl_teams": {"abbreviation": "SF"}},
+            ],
+        }
+    )
+    rows = queries_supabase.passing_dashboard(sb, season=2024, week=3, team=None, position=None, limit=25)
+    assert [(r["player_name"], r["team"], r["passing_yards"]) for r in rows] == [
+        ("Patrick Mahomes", "KC", 310),
+        ("Back Up", "KC", 120),
+        ("Trick Play", "SF", 30),
+    ]
+
+
+def test_passing_filter_falls_back_to_or_without_has_passing_column():
+    from src.database.supabase_client import SupabaseError
+
+    class NoColumnStub(SBStub):
+        def select(self, table, **kw):
+            if kw.get("select") == "has_passing":
+                raise SupabaseError("column has_passing does not exist", status_code=400, body='{"code":"42703"}')
+            return super().select(table, **kw)
+
+    assert queries_supabase._passing_rows_filter(NoColumnStub({}), "nfl_player_season_stats") == (
+        "or",
+        "(passing_yards.gt.0,passing_attempts.gt.0,passing_touchdowns.gt.0)",
+    )
+    assert queries_supabase._passing_rows_filter(SBStub({}), "nfl_player_season_stats") == ("has_passing", "eq.true")
+
+
+def test_select_pages_reads_past_the_per_response_row_cap():
+    calls = []
+
+    class CappedStub:
+        def select(self, table, *, select="*", filters=None, order=None, limit=None, offset=0):
+            calls.append((offset, limit))
+            # Mimic PostgREST max-rows: never more than 2 rows per response.
+            return [{"player_id": i} for i in range(offset, min(offset + limit, offset + 2, 5))]
+
+    rows = list(queries_supabase._select_pages(CappedStub(), "nfl_player_season_stats", page_size=2, limit=10))
+    assert [r["player_id"] for r in rows] == [0, 1, 2, 3, 4]
+    assert calls == [(0, 2), (2, 2), (4, 2)]
+
+
+def test_probes_do_not_cache_transient_errors_as_missing():
+    from src.database.supabase_client import SupabaseError
+
+    class FlakyStub(SBStub):
+        def __init__(self, data):
+            super().__init__(data)
+            self.down = True
+
+        def select(self, table, **kw):
+            if self.down and kw.get("select") == "has_passing":
+                raise SupabaseError("Select failed status=503", status_code=503)
+            return super().select(table, **kw)
+
+    sb = FlakyStub({})
+    with pytest.raises(SupabaseError):
+        queries_supabase._passing_rows_filter(sb, "nfl_player_season_stats")
+    sb.down = False
+    assert queries_supabase._passing_rows_filter(sb, "nfl_player_season_stats") == ("has_passing", "eq.true")
+
+
+def test_passing_dashboard_refills_rows_dropped_by_the_position_gate():
+    # "cb " passes the server-side not.in filter but not the trimmed Python check.
+    ordered = [
+        {"player_id": 1, "passing_yards": 300, "nfl_players": {"first_name": "A", "last_name": "One", "position_abbreviation": "QB"}},
+        {"player_id": 2, "passing_yards": 250, "nfl_players": {"first_name": "B", "last_name": "Two", "position_abbreviation": "cb "}},
+        {"player_id": 3, "passing_yards": 200, "nfl_players": {"first_name": "C", "last_name": "Three", "position_abbreviation": " QB"}},
+        {"player_id": 4, "passing_yards": 150, "nfl_players": {"first_name": "D", "last_name": "Four", "position_abbreviation": "QB"}},
+    ]
+    pages = []
+
+    class PagedStub(SBStub):
+        def select(self, table, *, select="*", filters=None, order=None, limit=None, offset=0):
+            if table != "nfl_player_game_stats" or select == "has_passing":
+                return super().select(table, select=select, filters=filters, order=order, limit=limit, offset=offset)
+            pages.append(offset)
+            return ordered[offset : offset + limit]
+
+    rows = queries_supabase.passing_dashboard(PagedStub({}), season=2024, week=9, team=None, position=None, limit=2)
+    assert [r["player_id"] for r in rows] == ["1", "3"]
+    assert pages == [0, 2]
@@ -0,0 +1,178 @@
+import gzip
+import http.client
+import json
+import socket
+import sqlite3
+import threading
+from contextlib import ExitStack
+
+import pytest
+
+from src.database.schema import create_tables
+from src.web import server
+
+
+def _make_db(path, label):
+    c = sqlite3.connect(path)
+    c.execute("CREATE TABLE meta(label TEXT)")
+    c.execute("INSERT INTO meta VALUES (?)", (label,))
+    c.commit()
+    c.close()
+
+
+def test_pooled_sqlite_follows_a_repointed_db_symlink(tmp_path):
+    _make_db(tmp_path / "v1.db", "v1")
+    _make_db(tmp_path / "v2.db", "v2")
+    main = tmp_path / "nfl_data.db"
+    main.symlink_to("v1.db")
+
+    with server._pooled_sqlite(main) as c:
+        assert c.execute("SELECT label FROM meta").fetchone()[0] == "v1"
+        # Same swap as scripts/manage_db_versions.py activate, while a connection is checked out.
+        main.unlink()
+        main.symlink_to("v2.db")
+
+    with server._pooled_sqlite(main) as c:
+        assert c.execute("SELECT label FROM meta").fetchone()[0] == "v2"
+    with server._pooled_sqlite(main) as c:
+        assert c.execute("SELECT label FROM meta").fetchone()[0] == "v2"
+
+
+def test_pooled_sqlite_keeps_a_bounded_number_of_idle_connections(tmp_path):
+    db = tmp_path / "burst.db"
+    _make_db(db, "x")
+    with ExitStack() as stack:
+        conns = [stack.enter_context(server._pooled_sqlite(db)) for _ in range(server._SQLITE_POOL_MAX_IDLE + 4)]
+        assert len({id(c) for c in conns}) == len(conns)
+    assert server._SQLITE_POOL[db][1].qsize() == server._SQLITE_POOL_MAX_IDLE
+
+
+@pytest.fixture()
+def live_server(tmp_path, monkeypatch):
+    db = tmp_path / "nfl_data.db"
+    c = sqlite3.connect(db)
+    create_tables(c)
+    c.close()
+    monkeypatch.setattr(server.Handler, "db_path", db, raising=False)
+    monkeypatch.setattr(server.Handler, "dist_path", tmp_path / "no-dist", raising=False)
+    monkeypatch.setattr(server.Handler, "_supabase_client", lambda self: None)
+    monkeypatch.setattr(server.Handler, "log_message", lambda self, *args: None)
+    httpd = server._make_server("127.0.0.1", 0)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd.server_address
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_idle_keep_alive_connections_do_not_block_new_clients(live_server):
+    idle = []
+    for _ in range(40):
+        conn = http.client.HTTPConnection(*live_server, timeout=5)
+        conn.request("GET", "/")
+        resp = conn.getresponse()
+        resp.read()
+        assert resp.status == 200 and not resp.will_close
+        idle.append(conn)  # left open: the server keeps waiting for its next request
+
+    fresh = http.client.HTTPConnection(*live_server, timeout=5)
+    fresh.request("GET", "/")
+    resp = fresh.getresponse()
+    resp.read()  # closing with unread data would reset the socket under the server thread
+    assert resp.status == 200
+    for conn in [fresh, *idle]:
+        conn.close()
+
+
+def _fake_players(n):
+    return [{"player_id": f"P{i}", "player_name": f"Player {i}", "player_position": "WR", "targets": i} for i in range(n)]
+
+
+def test_large_player_lists_stream_as_valid_chunked_json(live_server, monkeypatch):
+    players = _fake_players(server._STREAM_MIN_ROWS + server._STREAM_BATCH_ROWS // 2)
+    monkeypatch.setattr(server.queries, "get_players_list", lambda conn, **kw: [dict(p) for p in players])
+    monkeypatch.setattr(server.queries, "player_photo_url", lambda pid: None)
+
+    conn = http.client.HTTPConnection(*live_server, timeout=5)
+    conn.request("GET", "/api/players")
+    resp = conn.getresponse()
+    assert resp.getheader("Transfer-Encoding") == "chunked"
+    assert resp.getheader("Content-Length") is None
+    body = json.loads(resp.read())
+    assert body["nextOffset"] == len(players) and body["hasMore"] is False
+    assert [p["player_id"] for p in body["players"]] == [p["player_id"] for p in players]
+    assert body["players"][-1]["position"] == "WR"
+
+    # The terminating chunk leaves the connection usable for the next request.
+    conn.request("GET", "/")
+    resp = conn.getresponse()
+    resp.read()
+    assert resp.status == 200
+    conn.close()
+
+
+def test_http10_clients_get_a_content_length_body(live_server, monkeypatch):
+    players = _fake_players(server._STREAM_MIN_ROWS)
+    monkeypatch.setattr(server.queries, "get_players_list", lambda conn, **kw: [dict(p) for p in players])
+    monkeypatch.setattr(server.queries, "player_photo_url", lambda pid: None)
+
+    with socket.create_connection(live_server, timeout=5) as s:
+        s.sendall(b"GET /api/players HTTP/1.0\r\n\r\n")
+        raw = b""
+        while chunk := s.recv(65536):
+            raw += chunk
+    head, _, body = raw.partition(b"\r\n\r\n")
+    assert b"Transfer-Encoding" not in head
+    assert f"Content-Length: {len(body)}".encode() in head
+    assert len(json.loads(body)["players"]) == len(players)
+
+
+def test_json_responses_revalidate_with_if_none_match(live_server, monkeypatch):
+    monkeypatch.setattr(server.queries, "get_players_list", lambda conn, **kw: _fake_players(3))
+    monkeypatch.setattr(server.queries, "player_photo_url", lambda pid: None)
+    conn = http.client.HTTPConnection(*live_server, timeout=5)
+
+    for path in ("/api/options", "/api/players"):
+        conn.request("GET", path)
+        resp = conn.getresponse()
+        body = resp.read()
+        etag = resp.getheader("ETag")
+        assert resp.status == 200 and etag and resp.getheader("Cache-Control") == "no-cache"
+
+        for inm in (etag, f'"stale", W/{etag}', "*"):
+            conn.request("GET", path, headers={"If-None-Match": inm})
+            resp = conn.getresponse()
+            assert resp.status == 304
+            assert resp.read() == b""
+            assert resp.getheader("ETag") == etag
+
+        conn.request("GET", path, headers={"If-None-Match": '"stale"'})
+        resp = conn.getresponse()
+        assert resp.status == 200 and resp.read() == body
+    conn.close()
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "gzipped"),
+    [
+        ("gzip", True),
+        ("br, gzip;q=0.5", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("*;q=1, gzip;q=0", False),
+        ("identity", False),
+        (None, False),
+    ],
+)
+def test_index_page_honours_accept_encoding_q_values(live_server, accept_encoding, gzipped):
+    conn = http.client.HTTPConnection(*live_server, timeout=5)
+    conn.request("GET", "/", headers={"Accept-Encoding": accept_encoding} if accept_encoding else {})
+    resp = conn.getresponse()
+    body = resp.read()
+    conn.close()
+    assert resp.getheader("Vary") == "Accept-Encoding"
+    if gzipped:
+        assert resp.getheader("Content-Encoding") == "gzip"
+        assert gzip.decompress(body) == server.INDEX_HTML_BYTES
+    else:
+        assert resp.getheader("Content-Encoding") is None
+        assert body == server.INDEX_HTML_BYTES